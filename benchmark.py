@@ -0,0 +1,624 @@
+"""Benchmark the day solvers and catch slowdowns.
+
+Run with "$ python3 benchmark.py", or pass day selectors like runner.py does:
+"$ python3 benchmark.py 16B 17" benchmarks day16B plus both parts of day 17.
+
+Every benchmark is run several times on the real input. The timings are kept in
+.aoc_cache/benchmarks.json, and each run is compared against the stored baseline:
+a benchmark is flagged when it is both noticeably slower (--threshold) and the
+slowdown is statistically significant (one-sided Mann-Whitney U test, --alpha).
+Record a new baseline with --save-baseline.
+
+Solvers run with logging off by default. "--logging debug" times them with every
+debug message formatted, and "--logging production" re-runs this script under
+"python -O" so debug sites guarded by `if __debug__:` are compiled out; timings
+in those modes are stored under names like "day19B.main [debug]". Use
+"--compare-logging" to run all three modes and print them side by side.
+"""
+
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import generators
+import runner
+from grid import Grid
+from log import logger
+from puzzle_input import read_lines
+
+BENCHMARKS_FILE: str = os.path.join(runner.CACHE_DIRECTORY, "benchmarks.json")
+
+# only keep this many runs in the history file
+MAX_HISTORY_RUNS: int = 50
+
+LOGGING_MODES: List[str] = ["debug", "quiet", "production"]
+DEFAULT_LOGGING_MODE: str = "quiet"
+
+# days with logging in their hot loops, compared by default with --compare-logging
+LOGGING_HOT_SOLVERS: List[str] = ["day05B", "day12B", "day19B"]
+
+# day 1 is benchmarked on a generated input this many times the real one
+DAY01_SCALE: int = 3000
+
+# cards in the generated deck for day04B.count_scratchcards
+DAY04_DECK_SIZE: int = 2_000_000
+
+# day 7 hands are also sorted from a generated input this many times the real one
+DAY07_SCALE: int = 2000
+
+
+class Benchmark:
+    def __init__(
+        self,
+        name: str,
+        solver: str,
+        setup: Callable[[], Tuple],
+        run: Callable[..., Any],
+    ):
+        # setup() is not timed, and its result is passed to run(*args)
+        self.name: str = name
+        self.solver: str = solver
+        self.setup: Callable[[], Tuple] = setup
+        self.run: Callable[..., Any] = run
+
+
+class Comparison:
+    def __init__(self, name: str, samples: List[float], baseline: List[float]):
+        self.name: str = name
+        self.samples: List[float] = samples
+        self.baseline: List[float] = baseline
+
+        self.median: float = statistics.median(samples)
+        self.baseline_median: Optional[float] = (
+            statistics.median(baseline) if baseline else None
+        )
+        self.p_value: Optional[float] = (
+            mann_whitney_u_greater(samples, baseline) if baseline else None
+        )
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the median against the baseline, like 0.25 for 25% slower."""
+        if self.baseline_median is None or self.baseline_median == 0:
+            return None
+        return self.median / self.baseline_median - 1
+
+    def is_regression(self, threshold: float, alpha: float) -> bool:
+        return (
+            self.change is not None
+            and self.p_value is not None
+            and self.change > threshold
+            and self.p_value < alpha
+        )
+
+
+def read_input_lines(day: int) -> List[str]:
+    return read_lines(os.path.join(runner.REPO_DIRECTORY, f"inputs/day{day:02d}.txt"))
+
+
+def _setup_day01B() -> Tuple:
+    # a few million lines, so the cost per line is not lost in the noise
+    path: str = generators.ensure_generated_input(1, DAY01_SCALE)
+    return (read_lines(path),)
+
+
+def _setup_day04B() -> Tuple:
+    day04B = importlib.import_module("day04B")
+
+    winner_masks: List[int] = []
+    current_masks: List[int] = []
+
+    for line in read_input_lines(4):
+        winners, current = line.split(": ")[1].split(" | ")
+        winner_masks.append(day04B.to_mask(map(int, winners.split())))
+        current_masks.append(day04B.to_mask(map(int, current.split())))
+
+    return (winner_masks, current_masks)
+
+
+def _setup_day04B_deck() -> Tuple:
+    # every 1001st card wins the next 1000, so cards are won in long runs that end
+    # just before the next winner: a card holds at most a few copies, and the time
+    # goes into the runs rather than into adding up huge counts. One run near the
+    # end goes past the last card
+    all_num_matches: List[int] = [
+        1000 if i % 1001 == 0 or i == DAY04_DECK_SIZE - 500 else 0
+        for i in range(DAY04_DECK_SIZE)
+    ]
+
+    return (all_num_matches,)
+
+
+def _setup_day05B() -> Tuple:
+    input_lines: List[str] = read_input_lines(5)
+
+    seeds: List[int] = [int(s) for s in input_lines[0][len("seeds: ") :].split(" ")]
+    seed_ranges: List[Tuple[int, int]] = [
+        (seeds[i], seeds[i + 1]) for i in range(0, len(seeds), 2)
+    ]
+
+    mappings: List[List[Tuple[int, int, int]]] = []
+    for line in input_lines[1:]:
+        if line.endswith(":"):
+            mappings.append([])
+        elif line != "":
+            dest, source, length = [int(s) for s in line.split(" ")]
+            mappings[-1].append((dest, source, length))
+
+    return (seed_ranges, mappings)
+
+
+def _parse_day07(lines: List[str]) -> List[Tuple[str, int]]:
+    inputs: List[Tuple[str, int]] = []
+    for line in lines:
+        parts: List[str] = line.split(" ")
+        inputs.append((parts[0], int(parts[1])))
+
+    return inputs
+
+
+def _setup_day07() -> Tuple:
+    return (_parse_day07(read_input_lines(7)),)
+
+
+def _setup_day07_generated() -> Tuple:
+    # millions of hands, so sorting dominates rather than the per-call overhead
+    path: str = generators.ensure_generated_input(7, DAY07_SCALE)
+    return (_parse_day07(read_lines(path)),)
+
+
+def _setup_day16B() -> Tuple:
+    return (Grid.from_file(os.path.join(runner.REPO_DIRECTORY, "inputs/day16.txt")),)
+
+
+def _setup_day17(solver: str) -> Callable[[], Tuple]:
+    def setup() -> Tuple:
+        heat_loss: Grid = Grid.from_file(
+            os.path.join(runner.REPO_DIRECTORY, "inputs/day17.txt")
+        )
+        dest: Tuple[int, int] = (heat_loss.rows - 1, heat_loss.cols - 1)
+        return (heat_loss, (0, 0), dest, importlib.import_module(solver).RIGHT)
+
+    return setup
+
+
+def _setup_day19B() -> Tuple:
+    day19B = importlib.import_module("day19B")
+
+    name_to_workflow: Dict[str, Any] = {}
+    for line in read_input_lines(19):
+        if line == "":
+            break
+        brace_index: int = line.find("{")
+        name: str = line[:brace_index]
+        name_to_workflow[name] = day19B.Workflow(
+            name, line[1 + brace_index : -1].split(",")
+        )
+
+    return (name_to_workflow,)
+
+
+def _setup_day23B() -> Tuple:
+    day23B = importlib.import_module("day23B")
+
+    board: Grid = Grid.from_file(
+        os.path.join(runner.REPO_DIRECTORY, "inputs/day23.txt")
+    )
+    day23B.transform_board(board)
+
+    return (day23B.generate_graph(board),)
+
+
+def _core_function(solver: str, function_name: str) -> Callable[..., Any]:
+    """Look the function up lazily, so building the list imports no solver."""
+
+    def run(*args: Any) -> Any:
+        return getattr(importlib.import_module(solver), function_name)(*args)
+
+    return run
+
+
+def _main_benchmark(solver: str) -> Benchmark:
+    def setup() -> Tuple:
+        return ()
+
+    def run() -> Any:
+        return importlib.import_module(solver).main()
+
+    return Benchmark(f"{solver}.main", solver, setup, run)
+
+
+def get_benchmarks() -> List[Benchmark]:
+    benchmarks: List[Benchmark] = [
+        _main_benchmark(solver) for solver in runner.discover_solvers()
+    ]
+
+    benchmarks.extend(
+        [
+            Benchmark(
+                "day01B.sum_calibration_values",
+                "day01B",
+                _setup_day01B,
+                _core_function("day01B", "sum_calibration_values"),
+            ),
+            Benchmark(
+                "day04B.get_all_num_matches",
+                "day04B",
+                _setup_day04B,
+                _core_function("day04B", "get_all_num_matches"),
+            ),
+            Benchmark(
+                "day04B.count_scratchcards",
+                "day04B",
+                _setup_day04B_deck,
+                _core_function("day04B", "count_scratchcards"),
+            ),
+            Benchmark(
+                "day05B.get_min_location",
+                "day05B",
+                _setup_day05B,
+                _core_function("day05B", "get_min_location"),
+            ),
+            Benchmark(
+                "day05B.get_min_location_composed",
+                "day05B",
+                _setup_day05B,
+                _core_function("day05B", "get_min_location_composed"),
+            ),
+            Benchmark(
+                "day05B.get_min_location_reverse",
+                "day05B",
+                _setup_day05B,
+                _core_function("day05B", "get_min_location_reverse"),
+            ),
+            Benchmark(
+                "day07A.sorted_inputs",
+                "day07A",
+                _setup_day07,
+                _core_function("day07A", "sorted_inputs"),
+            ),
+            Benchmark(
+                "day07B.sorted_inputs",
+                "day07B",
+                _setup_day07,
+                _core_function("day07B", "sorted_inputs"),
+            ),
+            Benchmark(
+                "day07A.sorted_inputs.generated",
+                "day07A",
+                _setup_day07_generated,
+                _core_function("day07A", "sorted_inputs"),
+            ),
+            Benchmark(
+                "day07B.sorted_inputs.generated",
+                "day07B",
+                _setup_day07_generated,
+                _core_function("day07B", "sorted_inputs"),
+            ),
+            Benchmark(
+                "day16B.find_max_covered",
+                "day16B",
+                _setup_day16B,
+                _core_function("day16B", "find_max_covered"),
+            ),
+            Benchmark(
+                "day17A.dijkstra",
+                "day17A",
+                _setup_day17("day17A"),
+                _core_function("day17A", "dijkstra"),
+            ),
+            Benchmark(
+                "day17B.dijkstra",
+                "day17B",
+                _setup_day17("day17B"),
+                _core_function("day17B", "dijkstra"),
+            ),
+            Benchmark(
+                "day19B.run_ranges",
+                "day19B",
+                _setup_day19B,
+                _core_function("day19B", "run_ranges"),
+            ),
+            Benchmark(
+                "day23B.dfs",
+                "day23B",
+                _setup_day23B,
+                _core_function("day23B", "dfs"),
+            ),
+        ]
+    )
+
+    return sorted(benchmarks, key=lambda benchmark: benchmark.name)
+
+
+def mann_whitney_u_greater(samples: List[float], baseline: List[float]) -> float:
+    """p-value of the one-sided Mann-Whitney U test that samples tend to be larger
+    than baseline, using the normal approximation with tie and continuity correction.
+    """
+    n1: int = len(samples)
+    n2: int = len(baseline)
+
+    combined: List[Tuple[float, int]] = sorted(
+        [(value, 0) for value in samples] + [(value, 1) for value in baseline]
+    )
+
+    # average ranks over ties
+    ranks: List[float] = [0.0] * len(combined)
+    tie_correction: float = 0.0
+    i: int = 0
+    while i < len(combined):
+        j: int = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        num_tied: int = j - i + 1
+        tie_correction += num_tied**3 - num_tied
+        i = j + 1
+
+    rank_sum: float = sum(
+        rank for rank, (_, group) in zip(ranks, combined) if group == 0
+    )
+    u: float = rank_sum - n1 * (n1 + 1) / 2
+
+    mean_u: float = n1 * n2 / 2
+    n: int = n1 + n2
+    variance_u: float = n1 * n2 / 12 * ((n + 1) - tie_correction / (n * (n - 1)))
+    if variance_u <= 0:
+        return 1.0
+
+    z: float = (u - mean_u - 0.5) / math.sqrt(variance_u)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def mode_name(name: str, logging_mode: str) -> str:
+    """Name a benchmark's timings are stored under in a given logging mode."""
+    if logging_mode == DEFAULT_LOGGING_MODE:
+        return name
+    return f"{name} [{logging_mode}]"
+
+
+def set_logging_mode(logging_mode: str) -> None:
+    if logging_mode == "debug":
+        # format and emit every message, into a sink that throws it away
+        logger.set_level("DEBUG")
+        logger.remove()
+        logger.add(lambda message: None, level="DEBUG")
+    else:
+        logger.set_level("OFF")
+
+
+def compare_logging_modes(argv: List[str], selectors: List[str]) -> str:
+    """Benchmark in each logging mode, each in its own interpreter, and tabulate."""
+    medians: Dict[str, Dict[str, float]] = {}
+
+    for logging_mode in LOGGING_MODES:
+        interpreter_flags: List[str] = ["-O"] if logging_mode == "production" else []
+        subprocess.run(
+            [sys.executable, *interpreter_flags, os.path.abspath(__file__)]
+            + argv
+            + ["--logging", logging_mode]
+            + selectors,
+            check=False,
+            stdout=subprocess.DEVNULL,
+        )
+
+        results: Dict[str, List[float]] = load_history()["runs"][-1]["results"]
+        for name, samples in results.items():
+            base_name: str = name.split(" [")[0]
+            medians.setdefault(base_name, {})[logging_mode] = statistics.median(samples)
+
+    lines: List[str] = [
+        f"{'benchmark':<32} {'debug (s)':>10} {'quiet (s)':>10} {'production (s)':>15} {'saved':>7}"
+    ]
+    for name in sorted(medians):
+        times: Dict[str, float] = medians[name]
+        cells: List[str] = [
+            f"{times[logging_mode]:.4f}" if logging_mode in times else "-"
+            for logging_mode in LOGGING_MODES
+        ]
+        saved: str = (
+            f"{100 * (1 - times['production'] / times['debug']):.1f}%"
+            if "debug" in times and "production" in times and times["debug"] > 0
+            else "-"
+        )
+        lines.append(
+            f"{name:<32} {cells[0]:>10} {cells[1]:>10} {cells[2]:>15} {saved:>7}"
+        )
+
+    return "\n".join(lines)
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> List[float]:
+    samples: List[float] = []
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            args: Tuple = benchmark.setup()
+
+            start_time: float = time.perf_counter()
+            benchmark.run(*args)
+            samples.append(time.perf_counter() - start_time)
+
+    return samples
+
+
+def load_history(path: str = BENCHMARKS_FILE) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {"baseline": {}, "runs": []}
+
+    with open(path, "r") as fd:
+        return json.load(fd)
+
+
+def save_history(history: Dict[str, Any], path: str = BENCHMARKS_FILE) -> None:
+    history["runs"] = history["runs"][-MAX_HISTORY_RUNS:]
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fd:
+        json.dump(history, fd, indent=4, sort_keys=True)
+
+
+def format_comparisons(
+    comparisons: List[Comparison], threshold: float, alpha: float
+) -> str:
+    lines: List[str] = [
+        f"{'benchmark':<32} {'median (s)':>11} {'baseline (s)':>13} {'change':>8} {'p':>7}"
+    ]
+
+    for comparison in comparisons:
+        baseline: str = (
+            f"{comparison.baseline_median:.4f}"
+            if comparison.baseline_median is not None
+            else "-"
+        )
+        change: str = (
+            f"{100 * comparison.change:+.1f}%" if comparison.change is not None else "-"
+        )
+        p_value: str = (
+            f"{comparison.p_value:.3f}" if comparison.p_value is not None else "-"
+        )
+        flag: str = "  SLOWER" if comparison.is_regression(threshold, alpha) else ""
+
+        lines.append(
+            f"{comparison.name:<32} {comparison.median:>11.4f} {baseline:>13} {change:>8} {p_value:>7}{flag}"
+        )
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the day solvers.")
+    parser.add_argument(
+        "selectors",
+        nargs="*",
+        help='days to benchmark, like "5", "05B" or "day17A" (default: all)',
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="times to run each benchmark"
+    )
+    parser.add_argument(
+        "--max-runtime",
+        type=float,
+        default=60.0,
+        help="skip solvers whose last recorded run took longer than this many seconds",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="flag slowdowns of more than this fraction of the baseline (default: 0.05)",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.01,
+        help="significance level for flagging a slowdown (default: 0.01)",
+    )
+    parser.add_argument(
+        "--logging",
+        choices=LOGGING_MODES,
+        default=DEFAULT_LOGGING_MODE,
+        help="how much the solvers log while timed (default: quiet, which logs nothing)",
+    )
+    parser.add_argument(
+        "--compare-logging",
+        action="store_true",
+        help=f"benchmark in every logging mode and compare (default days: {', '.join(LOGGING_HOT_SOLVERS)})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store this run's timings as the baseline to compare against",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args: argparse.Namespace = parse_args(argv)
+
+    if args.compare_logging:
+        print(
+            compare_logging_modes(
+                ["--repeat", str(args.repeat), "--max-runtime", str(args.max_runtime)],
+                args.selectors or LOGGING_HOT_SOLVERS,
+            )
+        )
+        return 0
+
+    if args.logging == "production" and __debug__:
+        # `if __debug__:` blocks are only dropped when compiling under -O
+        os.execv(sys.executable, [sys.executable, "-O"] + sys.argv)
+
+    os.chdir(runner.REPO_DIRECTORY)
+    # some solvers drop into the debugger when done
+    os.environ["PYTHONBREAKPOINT"] = "0"
+    # solvers log heavily, which would swamp what is being measured
+    set_logging_mode(args.logging)
+
+    solvers: List[str] = runner.select_solvers(
+        runner.discover_solvers(), args.selectors
+    )
+    runtimes: Dict[str, float] = runner.load_runtimes()
+
+    history: Dict[str, Any] = load_history()
+    results: Dict[str, List[float]] = {}
+    comparisons: List[Comparison] = []
+    failures: List[str] = []
+
+    # the run is saved after every benchmark, so an interrupted run keeps the
+    # timings it got
+    history["runs"].append({"timestamp": time.time(), "results": results})
+
+    for benchmark in get_benchmarks():
+        if benchmark.solver not in solvers:
+            continue
+        if runtimes.get(benchmark.solver, 0.0) > args.max_runtime:
+            print(
+                f"Skipping {benchmark.name}: took {runtimes[benchmark.solver]:.0f}s last time",
+                file=sys.stderr,
+            )
+            continue
+
+        name: str = mode_name(benchmark.name, args.logging)
+        try:
+            results[name] = time_benchmark(benchmark, args.repeat)
+        except Exception as error:
+            print(f"{benchmark.name} failed: {error!r}", file=sys.stderr)
+            failures.append(benchmark.name)
+            continue
+
+        comparisons.append(
+            Comparison(name, results[name], history["baseline"].get(name, []))
+        )
+        if args.save_baseline:
+            history["baseline"][name] = results[name]
+        save_history(history)
+
+    print(format_comparisons(comparisons, args.threshold, args.alpha))
+
+    if failures:
+        print(f"Failed: {', '.join(failures)}", file=sys.stderr)
+
+    regressions: List[str] = [
+        comparison.name
+        for comparison in comparisons
+        if comparison.is_regression(args.threshold, args.alpha)
+    ]
+    if regressions:
+        print(f"Slower than baseline: {', '.join(regressions)}", file=sys.stderr)
+
+    return 1 if regressions or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
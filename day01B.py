@@ -1,3 +1,22 @@
+import os
+from collections import deque
+from types import ModuleType
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from log import time_solver
+from puzzle_input import read_lines
+
+# files at least this big are streamed in chunks over a process pool instead of
+# being read whole
+STREAMING_MIN_SIZE: int = 1 << 26
+
+# files at least this big are summed with numpy, when it is installed; importing
+# numpy takes longer than the scalar scanner needs for the real input
+VECTORIZED_MIN_SIZE: int = 1 << 20
+
+# bytes per chunk when streaming, so each worker holds at most about this much
+CHUNK_SIZE: int = 1 << 22
+
 ENGLISH_DIGITS = {
     "one": 1,
     "two": 2,
@@ -11,43 +30,235 @@ ENGLISH_DIGITS = {
 }
 
 
+# states of an Aho-Corasick automaton: transitions[state] maps the next character
+# to the next state (state 0 when it is missing), and outputs[state] is the digit
+# that was just read, or NO_DIGIT if none was
+Automaton = Tuple[List[Dict[str, int]], List[int]]
+NO_DIGIT: int = -1
+
+
+def build_automaton(words: Dict[str, int]) -> Automaton:
+    """Automaton that outputs a word's digit on reading the word's last character.
+
+    Failure links are folded into the transitions, so reading a character is a
+    single dict lookup, whatever the characters before it were.
+    """
+    transitions: List[Dict[str, int]] = [{}]
+    outputs: List[int] = [NO_DIGIT]
+
+    # trie of the words
+    for word, digit in words.items():
+        state: int = 0
+        for char in word:
+            if char not in transitions[state]:
+                transitions[state][char] = len(transitions)
+                transitions.append({})
+                outputs.append(NO_DIGIT)
+            state = transitions[state][char]
+        outputs[state] = digit
+
+    # breadth-first, so a state's failure state is complete before the state is
+    failure: List[int] = [0] * len(transitions)
+    queue: Deque[int] = deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        if outputs[state] == NO_DIGIT:
+            outputs[state] = outputs[failure[state]]
+
+        for char, next_state in list(transitions[state].items()):
+            failure[next_state] = transitions[failure[state]].get(char, 0)
+            queue.append(next_state)
+
+        # characters with no edge of their own go wherever the failure state goes
+        for char, next_state in transitions[failure[state]].items():
+            transitions[state].setdefault(char, next_state)
+
+    return transitions, outputs
+
+
+NUMERIC_DIGITS: Dict[str, int] = {str(digit): digit for digit in range(10)}
+
+# finds the first digit reading forwards, and the last one reading backwards;
+# no digit word is part of another, so the first word to end is the first to start
+FORWARD: Automaton = build_automaton({**NUMERIC_DIGITS, **ENGLISH_DIGITS})
+BACKWARD: Automaton = build_automaton(
+    {**NUMERIC_DIGITS, **{word[::-1]: digit for word, digit in ENGLISH_DIGITS.items()}}
+)
+
+
+def first_digit(chars: Iterable[str], automaton: Automaton) -> int:
+    transitions, outputs = automaton
+
+    state: int = 0
+    for char in chars:
+        state = transitions[state].get(char, 0)
+        if outputs[state] != NO_DIGIT:
+            return outputs[state]
+
+    return 0
+
+
 def process_line(line: str) -> int:
-    found_first_digit = False
-    first_digit = 0
-    last_digit = 0
+    # each scan stops at the first digit it reads, so the middle of the line is skipped
+    return 10 * first_digit(line, FORWARD) + first_digit(reversed(line), BACKWARD)
+
+
+def sum_calibration_values(lines: Iterable[str]) -> int:
+    answer: int = 0
+    for line in lines:
+        answer += process_line(line)
+
+    return answer
+
+
+def load_numpy() -> Optional[ModuleType]:
+    """numpy if it is installed, else None. It is optional, and only imported here."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
 
-    for i in range(len(line)):
-        current_digit = None
-        if "0" <= line[i] <= "9":
-            current_digit = ord(line[i]) - ord("0")
-        else:
-            for word in ENGLISH_DIGITS:
-                if i + len(word) <= len(line) and line[i : i + len(word)] == word:
-                    current_digit = ENGLISH_DIGITS[word]
 
-        if current_digit is not None:
-            if found_first_digit:
-                last_digit = current_digit
-            else:
-                first_digit = last_digit = current_digit
-                found_first_digit = True
+def sum_calibration_bytes(data: bytes, spelled_digits: bool = True) -> int:
+    """Vectorized sum_calibration_values over the raw bytes of a document.
 
-    return 10 * first_digit + last_digit
+    Instead of scanning each line, mark every position where a digit starts:
+    numeric digits with a table lookup per byte, and spelled-out digits by finding
+    their first letter and then checking the following letters only there. The
+    first and last marks of each line are found by grouping the marks by the line
+    they fall in. With spelled_digits False, only numeric digits count, as in part A.
+    """
+    np: Any = load_numpy()
+    if np is None:
+        raise ImportError("sum_calibration_bytes needs numpy")
+
+    text: Any = np.frombuffer(data, dtype=np.uint8)
+
+    # digit starting at each position, or NO_DIGIT
+    digit_of_byte: Any = np.full(256, NO_DIGIT, dtype=np.int8)
+    digit_of_byte[ord("0") : ord("9") + 1] = np.arange(10)
+    digits: Any = digit_of_byte[text]
+
+    if spelled_digits:
+        # pad, so a word can be compared past the end of the text
+        padded: Any = np.concatenate((text, np.zeros(5, dtype=np.uint8)))
+
+        # positions of each letter that starts a word, shared by six and seven
+        letter_positions: Dict[int, Any] = {}
+
+        for word, digit in ENGLISH_DIGITS.items():
+            encoded: bytes = word.encode()
+            if encoded[0] not in letter_positions:
+                letter_positions[encoded[0]] = np.flatnonzero(text == encoded[0])
+
+            # keep the positions where the rest of the word follows
+            starts: Any = letter_positions[encoded[0]]
+            for offset in range(1, len(encoded)):
+                starts = starts[padded[starts + offset] == encoded[offset]]
+            digits[starts] = digit
+
+    # no digit is spelled across a line break, since newlines are not letters
+    positions: Any = np.flatnonzero(digits != NO_DIGIT)
+    if len(positions) == 0:
+        return 0
+    lines: Any = np.searchsorted(np.flatnonzero(text == ord("\n")), positions)
+
+    # positions are sorted, so each line's digits are a run of equal line numbers
+    line_changes: Any = np.flatnonzero(np.diff(lines)) + 1
+    firsts: Any = np.concatenate(([0], line_changes))
+    lasts: Any = np.concatenate((line_changes - 1, [len(positions) - 1]))
+
+    first_digits: Any = digits[positions[firsts]].astype(np.int64)
+    last_digits: Any = digits[positions[lasts]].astype(np.int64)
+    return int(10 * first_digits.sum() + last_digits.sum())
+
+
+def chunk_ranges(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[int, int]]:
+    """(start, end) byte offsets of chunks of about chunk_size bytes that only end
+    after a newline (or at the end of the file), so no line is split between two.
+    """
+    size: int = os.path.getsize(path)
+
+    with open(path, "rb") as fd:
+        start: int = 0
+        while start < size:
+            end: int = min(start + chunk_size, size)
+
+            # move the end past the next newline
+            fd.seek(end)
+            while end < size:
+                block: bytes = fd.read(256)
+                newline: int = block.find(b"\n")
+                if newline != -1:
+                    end += newline + 1
+                    break
+                end += len(block)
+
+            yield (start, end)
+            start = end
+
+
+def sum_chunk(path: str, start: int, end: int) -> int:
+    with open(path, "rb") as fd:
+        fd.seek(start)
+        data: bytes = fd.read(end - start)
+
+    if load_numpy() is not None:
+        return sum_calibration_bytes(data)
+    return sum_calibration_values(data.decode().splitlines())
+
+
+def sum_calibration_file(
+    path: str, jobs: Optional[int] = None, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """Sum a calibration document of any size in chunks, on `jobs` processes.
+
+    At most two chunks per worker are in flight at once, so memory use depends
+    on the chunk size and the number of workers, not on the size of the file.
+    """
+    # only streamed files need the pool, and importing it slows down every start
+    import concurrent.futures
+
+    jobs = jobs or os.cpu_count() or 1
+    answer: int = 0
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending: Set[concurrent.futures.Future] = set()
+
+        for start, end in chunk_ranges(path, chunk_size):
+            if len(pending) >= 2 * jobs:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                answer += sum(future.result() for future in done)
+
+            pending.add(executor.submit(sum_chunk, path, start, end))
+
+        answer += sum(
+            future.result() for future in concurrent.futures.as_completed(pending)
+        )
+
+    return answer
 
 
 def main():
     input_file = "inputs/day01.txt"
 
-    input_lines = []
-    with open(input_file, "r") as fd:
-        input_lines = fd.readlines()
-
-    answer = 0
-    for line in input_lines:
-        answer += process_line(line)
+    size: int = os.path.getsize(input_file)
+    if size >= STREAMING_MIN_SIZE:
+        answer = sum_calibration_file(input_file)
+    elif size >= VECTORIZED_MIN_SIZE and load_numpy() is not None:
+        with open(input_file, "rb") as fd:
+            answer = sum_calibration_bytes(fd.read())
+    else:
+        answer = sum_calibration_values(read_lines(input_file))
 
     print(f"{answer=}")  # 53268
 
+    return answer
+
 
 if __name__ == "__main__":
-    main()
+    time_solver(main)
@@ -1,74 +1,196 @@
-from typing import List, Tuple
+import bisect
+from array import array
+from typing import Iterator, List, Optional, Tuple
 
-DEBUG = False
+from log import time_solver
 
+DEBUG = False
 
-def game_possible(
-    subsets: List[Tuple[int, int, int]], proposed: Tuple[int, int, int]
-) -> bool:
-    for subset in subsets:
-        if (
-            subset[0] > proposed[0]
-            or subset[1] > proposed[1]
-            or subset[2] > proposed[2]
+# most cells the BagIndex prefix-sum table may have; past this, queries scan
+MAX_INDEX_CELLS: int = 1 << 21
+
+# bags asked about before building a BagIndex pays off over scanning per bag
+INDEX_MIN_BAGS: int = 100
+
+
+class Games:
+    """Game records stored column by column, one row per game.
+
+    Both parts only need the most cubes of each color shown at once, so that is
+    all that is kept of a game's subsets.
+    """
+
+    def __init__(self):
+        self.ids: array = array("q")
+        # per game, the max of each color over its subsets, kept up while parsing
+        self.max_reds: array = array("q")
+        self.max_greens: array = array("q")
+        self.max_blues: array = array("q")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def maxima(self, game: int) -> Tuple[int, int, int]:
+        """Most red, green and blue cubes shown at once in a game."""
+        return (self.max_reds[game], self.max_greens[game], self.max_blues[game])
+
+
+def parse_games(text: str) -> Games:
+    """Parse every record in one pass over the words of the text.
+
+    "Game 1: 3 blue, 4 red; 1 red" is the words "Game", "1:", "3", "blue,", "4",
+    "red;", "1", "red": a color word ending in "," continues the subset, one ending
+    in ";" ends the subset, and one with neither ends the game.
+    """
+    games: Games = Games()
+    red: int = 0
+    green: int = 0
+    blue: int = 0
+    max_red: int = 0
+    max_green: int = 0
+    max_blue: int = 0
+
+    # words come in pairs: ("Game", "<id>:") or ("<count>", "<color><separator>")
+    words: Iterator[str] = iter(text.split())
+    for word in words:
+        color: str = next(words)
+        if word == "Game":
+            games.ids.append(int(color[:-1]))
+            continue
+
+        if color[0] == "r":
+            red += int(word)
+        elif color[0] == "g":
+            green += int(word)
+        else:
+            blue += int(word)
+
+        if color[-1] != ",":
+            if red > max_red:
+                max_red = red
+            if green > max_green:
+                max_green = green
+            if blue > max_blue:
+                max_blue = blue
+            red = green = blue = 0
+
+            if color[-1] != ";":
+                games.max_reds.append(max_red)
+                games.max_greens.append(max_green)
+                games.max_blues.append(max_blue)
+                max_red = max_green = max_blue = 0
+
+    return games
+
+
+def game_possible(games: Games, game: int, proposed: Tuple[int, int, int]) -> bool:
+    red, green, blue = games.maxima(game)
+    return red <= proposed[0] and green <= proposed[1] and blue <= proposed[2]
+
+
+def possible_id_sum_by_scan(games: Games, bag: Tuple[int, int, int]) -> int:
+    return sum(
+        games.ids[game] for game in range(len(games)) if game_possible(games, game, bag)
+    )
+
+
+class BagIndex:
+    """Answers "which games are possible with this bag?" for many bags, as the sum
+    of those games' ids.
+
+    A game is possible with a bag when the bag dominates the game's maxima in all
+    three colors. The distinct maxima of each color are sorted into an axis, and
+    id_sums[r][g][b] (flattened) holds the sum of the ids of all games whose maxima
+    are at most the r-th, g-th and b-th axis values: a 3D prefix sum. A query is
+    then a binary search on each axis and one lookup, however many games there are.
+
+    The table has a cell for every combination of distinct maxima, so with many
+    distinct counts it could get huge. Past max_cells it is not built, and
+    queries scan the games instead.
+    """
+
+    def __init__(self, games: Games, max_cells: int = MAX_INDEX_CELLS):
+        self.games: Games = games
+        self.red_axis: List[int] = sorted(set(games.max_reds))
+        self.green_axis: List[int] = sorted(set(games.max_greens))
+        self.blue_axis: List[int] = sorted(set(games.max_blues))
+
+        # one extra row, column and layer of zeros in front, for bags that
+        # dominate no game in some color
+        self.sizes: Tuple[int, int, int] = (
+            len(self.red_axis) + 1,
+            len(self.green_axis) + 1,
+            len(self.blue_axis) + 1,
+        )
+        num_reds, num_greens, num_blues = self.sizes
+
+        self.id_sums: Optional[List[int]] = None
+        if num_reds * num_greens * num_blues > max_cells:
+            return
+
+        id_sums: List[int] = [0] * (num_reds * num_greens * num_blues)
+
+        for game in range(len(games)):
+            red, green, blue = games.maxima(game)
+            red_index: int = bisect.bisect_left(self.red_axis, red) + 1
+            green_index: int = bisect.bisect_left(self.green_axis, green) + 1
+            blue_index: int = bisect.bisect_left(self.blue_axis, blue) + 1
+            cell: int = (red_index * num_greens + green_index) * num_blues + blue_index
+            id_sums[cell] += games.ids[game]
+
+        # running sums along blue, then green, then red
+        for stride, size in (
+            (1, num_blues),
+            (num_blues, num_greens),
+            (num_greens * num_blues, num_reds),
         ):
-            return False
+            for cell in range(len(id_sums)):
+                if (cell // stride) % size != 0:
+                    id_sums[cell] += id_sums[cell - stride]
 
-    return True
+        self.id_sums = id_sums
 
+    def possible_id_sum(self, bag: Tuple[int, int, int]) -> int:
+        """Sum of the ids of the games that are possible with `bag`."""
+        if self.id_sums is None:
+            return possible_id_sum_by_scan(self.games, bag)
 
-def main() -> None:
-    input_file = "inputs/day02.txt"
+        _, num_greens, num_blues = self.sizes
+        red: int = bisect.bisect_right(self.red_axis, bag[0])
+        green: int = bisect.bisect_right(self.green_axis, bag[1])
+        blue: int = bisect.bisect_right(self.blue_axis, bag[2])
 
-    if DEBUG:
-        input_file = "inputs/dummy.txt"
-
-    input_lines = []
-    with open(input_file, "r") as fd:
-        input_lines = fd.readlines()
+        return self.id_sums[(red * num_greens + green) * num_blues + blue]
 
-    answer = 0
-    for line in input_lines:
-        id_start_index = len("Game ")
-        id_end_index = line.find(":")
+    def possible_id_sums(self, bags: List[Tuple[int, int, int]]) -> List[int]:
+        return [self.possible_id_sum(bag) for bag in bags]
 
-        game_subsets = []
 
-        game_id: int = int(line[id_start_index:id_end_index])
+def possible_id_sums(games: Games, bags: List[Tuple[int, int, int]]) -> List[int]:
+    """Sum of the ids of the possible games for each bag. A few bags are answered
+    by scanning the games; for many, a BagIndex is built once and queried.
+    """
+    if len(bags) < INDEX_MIN_BAGS:
+        return [possible_id_sum_by_scan(games, bag) for bag in bags]
 
-        game_line = line[id_end_index + len(": ") :]
-        game_subset_lines: List[str] = game_line.split("; ")
+    return BagIndex(games).possible_id_sums(bags)
 
-        for game_subset_line in game_subset_lines:
-            # "1 blue, 2 green"
-            split_colors = game_subset_line.split(", ")
-            # ['1 blue', '2 green']
 
-            num_red = 0
-            num_green = 0
-            num_blue = 0
-
-            for num_and_color in split_colors:
-                # '1 blue'
-                num_and_color_split = num_and_color.strip().split(" ")
-                num_color = int(num_and_color_split[0])
-                color_name = num_and_color_split[1]
+def main() -> int:
+    input_file = "inputs/day02.txt"
 
-                if color_name == "red":
-                    num_red += num_color
-                elif color_name == "green":
-                    num_green += num_color
-                elif color_name == "blue":
-                    num_blue += num_color
+    if DEBUG:
+        input_file = "inputs/dummy.txt"
 
-            game_subsets.append((num_red, num_green, num_blue))
+    with open(input_file, "r") as fd:
+        games: Games = parse_games(fd.read())
 
-        print(f"{game_subsets=}")
-        if game_possible(game_subsets, (12, 13, 14)):
-            answer += game_id
+    answer = possible_id_sums(games, [(12, 13, 14)])[0]
 
     print(f"{answer=}")  # 2207
 
+    return answer
+
 
 if __name__ == "__main__":
-    main()
+    time_solver(main)
@@ -1,66 +1,103 @@
-from typing import List, Tuple
+from array import array
+from typing import Iterator, Tuple
 
-DEBUG = False
-
-
-def game_power(subsets: List[Tuple[int, int, int]]) -> int:
-    best = [0, 0, 0]
-
-    for subset in subsets:
-        for i in range(3):
-            best[i] = max(best[i], subset[i])
+from log import time_solver
 
-    return best[0] * best[1] * best[2]
+DEBUG = False
 
 
-def main() -> None:
+class Games:
+    """Game records stored column by column, one row per game.
+
+    Both parts only need the most cubes of each color shown at once, so that is
+    all that is kept of a game's subsets.
+    """
+
+    def __init__(self):
+        self.ids: array = array("q")
+        # per game, the max of each color over its subsets, kept up while parsing
+        self.max_reds: array = array("q")
+        self.max_greens: array = array("q")
+        self.max_blues: array = array("q")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def maxima(self, game: int) -> Tuple[int, int, int]:
+        """Most red, green and blue cubes shown at once in a game."""
+        return (self.max_reds[game], self.max_greens[game], self.max_blues[game])
+
+
+def parse_games(text: str) -> Games:
+    """Parse every record in one pass over the words of the text.
+
+    "Game 1: 3 blue, 4 red; 1 red" is the words "Game", "1:", "3", "blue,", "4",
+    "red;", "1", "red": a color word ending in "," continues the subset, one ending
+    in ";" ends the subset, and one with neither ends the game.
+    """
+    games: Games = Games()
+    red: int = 0
+    green: int = 0
+    blue: int = 0
+    max_red: int = 0
+    max_green: int = 0
+    max_blue: int = 0
+
+    # words come in pairs: ("Game", "<id>:") or ("<count>", "<color><separator>")
+    words: Iterator[str] = iter(text.split())
+    for word in words:
+        color: str = next(words)
+        if word == "Game":
+            games.ids.append(int(color[:-1]))
+            continue
+
+        if color[0] == "r":
+            red += int(word)
+        elif color[0] == "g":
+            green += int(word)
+        else:
+            blue += int(word)
+
+        if color[-1] != ",":
+            if red > max_red:
+                max_red = red
+            if green > max_green:
+                max_green = green
+            if blue > max_blue:
+                max_blue = blue
+            red = green = blue = 0
+
+            if color[-1] != ";":
+                games.max_reds.append(max_red)
+                games.max_greens.append(max_green)
+                games.max_blues.append(max_blue)
+                max_red = max_green = max_blue = 0
+
+    return games
+
+
+def game_power(games: Games, game: int) -> int:
+    red, green, blue = games.maxima(game)
+    return red * green * blue
+
+
+def main() -> int:
     input_file = "inputs/day02.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines = []
     with open(input_file, "r") as fd:
-        input_lines = fd.readlines()
+        games: Games = parse_games(fd.read())
 
     answer = 0
-    for line in input_lines:
-        id_end_index = line.find(":")
-
-        game_subsets = []
-
-        game_line = line[id_end_index + len(": ") :]
-        game_subset_lines: List[str] = game_line.split("; ")
-
-        for game_subset_line in game_subset_lines:
-            # "1 blue, 2 green"
-            split_colors = game_subset_line.split(", ")
-            # ['1 blue', '2 green']
-
-            num_red = 0
-            num_green = 0
-            num_blue = 0
-
-            for num_and_color in split_colors:
-                # '1 blue'
-                num_and_color_split = num_and_color.strip().split(" ")
-                num_color = int(num_and_color_split[0])
-                color_name = num_and_color_split[1]
-
-                if color_name == "red":
-                    num_red += num_color
-                elif color_name == "green":
-                    num_green += num_color
-                elif color_name == "blue":
-                    num_blue += num_color
-
-            game_subsets.append((num_red, num_green, num_blue))
-
-        print(f"{game_subsets=}")
-        answer += game_power(game_subsets)
+    for game in range(len(games)):
+        answer += game_power(games, game)
 
     print(f"{answer=}")  # 62241
 
+    return answer
+
 
 if __name__ == "__main__":
-    main()
+    time_solver(main)
@@ -1,73 +1,150 @@
-from typing import List
+import concurrent.futures
+import os
+import re
+from array import array
+from typing import Iterator, List, Optional, Set
 
-DEBUG = False
-
-
-def valid(r, c, R, C):
-    return 0 <= r < R and 0 <= c < C
-
-
-def print_board(board):
-    for row in board:
-        for c in row:
-            if c:
-                print("1", end="")
-            else:
-                print("0", end="")
-        print()
-
-
-def process_board(board: List[str]) -> int:
-    R = len(board)
-    C = len(board[0])
-
-    good_digits = [[False for c in range(C)] for r in range(R)]
-
-    for row in range(R):
-        for col in range(C):
-            character = board[row][col]
-
-            if character != "." and not ("0" <= character <= "9"):
-                # is symbol
-
-                for dr in (-1, 0, 1):
-                    for dc in (-1, 0, 1):
-                        if (
-                            valid(row + dr, col + dc, R, C)
-                            and "0" <= board[row + dr][col + dc] <= "9"
-                        ):
-                            good_digits[row + dr][col + dc] = True
+from grid import Grid
+from log import time_solver
 
-    print_board(good_digits)
-
-    for row in range(R):
-        for col in range(1, C):
-            if "0" <= board[row][col] <= "9" and good_digits[row][col - 1]:
-                good_digits[row][col] = True
-
-        for col in range(C - 2, -1, -1):
-            if "0" <= board[row][col] <= "9" and good_digits[row][col + 1]:
-                good_digits[row][col] = True
-
-    print("now")
-    print_board(good_digits)
-
-    answer = 0
-
-    for row in range(R):
-        my_num = 0
-        for col in range(C):
-            if good_digits[row][col]:
-                digit = ord(board[row][col]) - ord("0")
-                my_num = 10 * my_num + digit
-            else:
-                answer += my_num
-                my_num = 0
-
-        answer += my_num
-        my_num = 0
+DEBUG = False
 
-    return answer
+# boards with at least this many rows are split into bands of BAND_ROWS rows,
+# which are solved in a process pool
+PARALLEL_MIN_ROWS = 2000
+BAND_ROWS = 500
+
+
+NUMBER = re.compile(rb"[0-9]+")
+SYMBOL = re.compile(rb"[^.0-9]")
+
+
+class NumberSpans:
+    """Every number on the board, labeled in one scan.
+
+    The board is copied with a border of "." all around, so that one regex scan
+    finds every number without running from one row into the next, and the cells
+    around any symbol can be read without bounds checks. Positions below are
+    indices into that padded copy, whose rows are C + 2 wide.
+
+    Number i (counting from 1) is on row rows[i], columns starts[i] up to ends[i]
+    of the board, with value values[i]. labels[position] is the number covering
+    that position, or 0 for none.
+    """
+
+    def __init__(self, board: Grid):
+        R = board.rows
+        C = board.cols
+        self.width = C + 2
+
+        border = b"." * self.width
+        rows = (b"." + board.row(row) + b"." for row in range(R))
+        self.cells: bytes = border + b"".join(rows) + border
+
+        # index 0 stands for "no number"
+        self.rows: array = array("q", [0])
+        self.starts: array = array("q", [0])
+        self.ends: array = array("q", [0])
+        self.values: array = array("q", [0])
+        self.labels: array = array("i", bytes(4 * len(self.cells)))
+
+        labels = self.labels
+        for match in NUMBER.finditer(self.cells):
+            start, end = match.span()
+            label = len(self.values)
+
+            row, col = divmod(start, self.width)
+            self.rows.append(row - 1)
+            self.starts.append(col - 1)
+            self.ends.append(col - 1 + end - start)
+            self.values.append(int(match.group()))
+
+            for position in range(start, end):
+                labels[position] = label
+
+        # from a position to the 8 positions around it
+        self.neighbor_steps: List[int] = [
+            dr * self.width + dc
+            for dr in (-1, 0, 1)
+            for dc in (-1, 0, 1)
+            if (dr, dc) != (0, 0)
+        ]
+
+    def symbol_positions(
+        self, first_row: int = 0, end_row: Optional[int] = None
+    ) -> Iterator[int]:
+        """Positions of the symbols on rows first_row up to end_row of the board."""
+        if end_row is None:
+            end_row = len(self.cells) // self.width - 2
+
+        start = (first_row + 1) * self.width
+        end = (end_row + 1) * self.width
+        for match in SYMBOL.finditer(self.cells, start, end):
+            yield match.start()
+
+    def adjacent_labels(self, position: int) -> Set[int]:
+        """Numbers touching a position, including diagonally."""
+        labels = self.labels
+        adjacent = {labels[position + step] for step in self.neighbor_steps}
+        adjacent.discard(0)
+        return adjacent
+
+
+def sum_part_numbers(
+    board: Grid, first_row: int = 0, end_row: Optional[int] = None
+) -> int:
+    """Sum of the part numbers on rows first_row up to end_row of the board.
+
+    Symbols on the other rows still count, so a band of rows with one row of
+    context above and below gets exactly the part numbers on the band's rows.
+    """
+    if end_row is None:
+        end_row = board.rows
+    spans = NumberSpans(board)
+
+    # numbers next to at least one symbol are part numbers
+    part_labels: Set[int] = set()
+    for position in spans.symbol_positions():
+        part_labels |= spans.adjacent_labels(position)
+
+    return sum(
+        spans.values[label]
+        for label in part_labels
+        if first_row <= spans.rows[label] < end_row
+    )
+
+
+def solve_band(band: bytes, cols: int, first_row: int, end_row: int) -> int:
+    board = Grid(len(band) // cols, cols, bytearray(band))
+    return sum_part_numbers(board, first_row, end_row)
+
+
+def process_board(board: Grid, jobs: int = 1, band_rows: int = BAND_ROWS) -> int:
+    """Solve the board, in bands of band_rows rows on `jobs` processes.
+
+    Each band is sent with one more row above and below it, and only counts the
+    numbers on its own rows: a number on a band's edge row is seen by the next
+    band too, but only added up once.
+    """
+    if jobs == 1:
+        return sum_part_numbers(board)
+
+    R = board.rows
+    C = board.cols
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = []
+        for first_row in range(0, R, band_rows):
+            end_row = min(first_row + band_rows, R)
+            top = max(first_row - 1, 0)
+            bottom = min(end_row + 1, R)
+
+            band = bytes(board.data[top * C : bottom * C])
+            futures.append(
+                executor.submit(solve_band, band, C, first_row - top, end_row - top)
+            )
+
+        return sum(future.result() for future in futures)
 
 
 def main():
@@ -76,14 +153,15 @@ def main():
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    board = Grid.from_file(input_file)
 
-    answer = process_board(input_lines)
+    jobs = (os.cpu_count() or 1) if board.rows >= PARALLEL_MIN_ROWS else 1
+    answer = process_board(board, jobs)
 
     print(f"{answer=}")  # 538046
 
+    return answer
+
 
 if __name__ == "__main__":
-    main()
+    time_solver(main)
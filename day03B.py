@@ -1,80 +1,144 @@
-from typing import List
+import concurrent.futures
+import os
+import re
+from array import array
+from typing import Iterator, List, Optional, Set
+
+from grid import Grid
+from log import time_solver
 
 DEBUG = False
 
+# boards with at least this many rows are split into bands of BAND_ROWS rows,
+# which are solved in a process pool
+PARALLEL_MIN_ROWS = 2000
+BAND_ROWS = 500
+
+
+NUMBER = re.compile(rb"[0-9]+")
+SYMBOL = re.compile(rb"[^.0-9]")
+
+
+class NumberSpans:
+    """Every number on the board, labeled in one scan.
+
+    The board is copied with a border of "." all around, so that one regex scan
+    finds every number without running from one row into the next, and the cells
+    around any symbol can be read without bounds checks. Positions below are
+    indices into that padded copy, whose rows are C + 2 wide.
+
+    Number i (counting from 1) is on row rows[i], columns starts[i] up to ends[i]
+    of the board, with value values[i]. labels[position] is the number covering
+    that position, or 0 for none.
+    """
+
+    def __init__(self, board: Grid):
+        R = board.rows
+        C = board.cols
+        self.width = C + 2
+
+        border = b"." * self.width
+        rows = (b"." + board.row(row) + b"." for row in range(R))
+        self.cells: bytes = border + b"".join(rows) + border
+
+        # index 0 stands for "no number"
+        self.rows: array = array("q", [0])
+        self.starts: array = array("q", [0])
+        self.ends: array = array("q", [0])
+        self.values: array = array("q", [0])
+        self.labels: array = array("i", bytes(4 * len(self.cells)))
+
+        labels = self.labels
+        for match in NUMBER.finditer(self.cells):
+            start, end = match.span()
+            label = len(self.values)
+
+            row, col = divmod(start, self.width)
+            self.rows.append(row - 1)
+            self.starts.append(col - 1)
+            self.ends.append(col - 1 + end - start)
+            self.values.append(int(match.group()))
+
+            for position in range(start, end):
+                labels[position] = label
+
+        # from a position to the 8 positions around it
+        self.neighbor_steps: List[int] = [
+            dr * self.width + dc
+            for dr in (-1, 0, 1)
+            for dc in (-1, 0, 1)
+            if (dr, dc) != (0, 0)
+        ]
+
+    def symbol_positions(
+        self, first_row: int = 0, end_row: Optional[int] = None
+    ) -> Iterator[int]:
+        """Positions of the symbols on rows first_row up to end_row of the board."""
+        if end_row is None:
+            end_row = len(self.cells) // self.width - 2
+
+        start = (first_row + 1) * self.width
+        end = (end_row + 1) * self.width
+        for match in SYMBOL.finditer(self.cells, start, end):
+            yield match.start()
+
+    def adjacent_labels(self, position: int) -> Set[int]:
+        """Numbers touching a position, including diagonally."""
+        labels = self.labels
+        adjacent = {labels[position + step] for step in self.neighbor_steps}
+        adjacent.discard(0)
+        return adjacent
+
+
+def sum_gear_ratios(
+    board: Grid, first_row: int = 0, end_row: Optional[int] = None
+) -> int:
+    """Sum of the gear ratios of the symbols on rows first_row up to end_row."""
+    spans = NumberSpans(board)
+
+    answer = 0
 
-def valid(r, c, R, C):
-    return 0 <= r < R and 0 <= c < C
+    for position in spans.symbol_positions(first_row, end_row):
+        parts = spans.adjacent_labels(position)
 
+        if len(parts) == 2:
+            first, second = parts
+            answer += spans.values[first] * spans.values[second]
 
-def print_board(board):
-    for row in board:
-        for c in row:
-            if c:
-                print("1", end="")
-            else:
-                print("0", end="")
-        print()
+    return answer
 
 
-def process_board(board: List[str]) -> int:
-    R = len(board)
-    C = len(board[0])
+def solve_band(band: bytes, cols: int, first_row: int, end_row: int) -> int:
+    board = Grid(len(band) // cols, cols, bytearray(band))
+    return sum_gear_ratios(board, first_row, end_row)
 
-    used = [[False for c in range(C)] for r in range(R)]
 
-    answer = 0
+def process_board(board: Grid, jobs: int = 1, band_rows: int = BAND_ROWS) -> int:
+    """Solve the board, in bands of band_rows rows on `jobs` processes.
 
-    for row in range(R):
-        for col in range(C):
-            c = board[row][col]
-
-            if c != "." and not ("0" <= c <= "9"):
-                # is symbol
-
-                parts = []
-
-                for dr in (-1, 0, 1):
-                    for dc in (-1, 0, 1):
-                        if (
-                            valid(row + dr, col + dc, R, C)
-                            and "0" <= board[row + dr][col + dc] <= "9"
-                            and not used[row + dr][col + dc]
-                        ):
-                            new_row = row + dr
-                            new_col = col + dc
-
-                            # expand it first; set to "used" in used
-                            used[new_row][new_col] = True
-                            right_col = new_col + 1
-                            while (
-                                right_col < C
-                                and "0" <= board[new_row][right_col] <= "9"
-                            ):
-                                used[new_row][right_col] = True
-                                right_col += 1
-
-                            left_col = new_col - 1
-                            while (
-                                left_col >= 0 and "0" <= board[new_row][left_col] <= "9"
-                            ):
-                                used[new_row][left_col] = True
-                                left_col -= 1
-
-                            part_value = 0
-                            for i in range(left_col + 1, right_col):
-                                part_value = (
-                                    10 * part_value + ord(board[new_row][i]) - ord("0")
-                                )
-
-                            parts.append(part_value)
-
-                print(f"At {row=}, {col=}, we have {parts=}")
-
-                if len(parts) == 2:
-                    answer += parts[0] * parts[1]
+    Each band is sent with one more row above and below it, so every number next
+    to its symbols is whole, and only counts the symbols on its own rows: numbers
+    on a band's edge row are seen by two bands, but each gear by only one.
+    """
+    if jobs == 1:
+        return sum_gear_ratios(board)
 
-    return answer
+    R = board.rows
+    C = board.cols
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = []
+        for first_row in range(0, R, band_rows):
+            end_row = min(first_row + band_rows, R)
+            top = max(first_row - 1, 0)
+            bottom = min(end_row + 1, R)
+
+            band = bytes(board.data[top * C : bottom * C])
+            futures.append(
+                executor.submit(solve_band, band, C, first_row - top, end_row - top)
+            )
+
+        return sum(future.result() for future in futures)
 
 
 def main():
@@ -83,14 +147,15 @@ def main():
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    board = Grid.from_file(input_file)
 
-    answer = process_board(input_lines)
+    jobs = (os.cpu_count() or 1) if board.rows >= PARALLEL_MIN_ROWS else 1
+    answer = process_board(board, jobs)
 
     print(f"{answer=}")  # 81709807
 
+    return answer
+
 
 if __name__ == "__main__":
-    main()
+    time_solver(main)
@@ -1,23 +1,31 @@
-from typing import List
+import functools
+import operator
+from typing import Iterable, List
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG = False
 
 
-def calc_score(winners: List[int], current_card: List[int]):
-    current_score = 0
+# BITS[num] is the bit standing for card number num
+BITS = [1 << num for num in range(100)]
 
-    winner_set = set(winners)
 
-    for num in current_card:
-        if num in winner_set:
-            if current_score == 0:
-                current_score = 1
-            else:
-                current_score *= 2
+def to_mask(numbers: Iterable[int]) -> int:
+    """A card's numbers, which are below 100, as the bits of an int."""
+    return functools.reduce(operator.or_, map(BITS.__getitem__, numbers), 0)
 
-    return current_score
+
+def score_from_masks(winner_mask: int, current_mask: int) -> int:
+    num_matches = (winner_mask & current_mask).bit_count()
+
+    return 1 << (num_matches - 1) if num_matches else 0
+
+
+def calc_scores(winner_masks: List[int], current_masks: List[int]) -> List[int]:
+    """Score of every card, from the cards' masks."""
+    return list(map(score_from_masks, winner_masks, current_masks))
 
 
 def main():
@@ -26,27 +34,29 @@ def main():
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines = read_lines(input_file)
 
-    answer = 0
+    winner_masks = []
+    current_masks = []
 
     for line in input_lines:
         numbers = line.split(": ")[1]
 
         winners, current = numbers.split(" | ")
 
-        logger.debug(f"{winners=}")
-        logger.debug(f"{current=}")
+        if __debug__:
+            logger.debug("winners={!r}", winners)
+            logger.debug("current={!r}", current)
 
-        winner_list = [int(s) for s in winners.split(" ") if s != ""]
-        current_list = [int(s) for s in current.split(" ") if s != ""]
+        winner_masks.append(to_mask(map(int, winners.split())))
+        current_masks.append(to_mask(map(int, current.split())))
 
-        answer += calc_score(winner_list, current_list)
+    answer = sum(calc_scores(winner_masks, current_masks))
 
     logger.info(f"{answer=}")  # 25004
 
+    return answer
+
 
 if __name__ == "__main__":
-    main()
+    time_solver(main)
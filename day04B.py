@@ -1,67 +1,88 @@
-from typing import List, Set
+import functools
+import operator
+from typing import Iterable, List
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
 
-def get_num_matches(winners: List[int], current_card: List[int]) -> int:
-    num_matches: int = 0
-    winner_set: Set[int] = set(winners)
+# BITS[num] is the bit standing for card number num
+BITS: List[int] = [1 << num for num in range(100)]
 
-    for num in current_card:
-        if num in winner_set:
-            num_matches += 1
 
-    return num_matches
+def to_mask(numbers: Iterable[int]) -> int:
+    """A card's numbers, which are below 100, as the bits of an int."""
+    return functools.reduce(operator.or_, map(BITS.__getitem__, numbers), 0)
 
 
-def calc_total_scratchcards(
-    all_winners: List[List[int]], all_current: List[List[int]]
-) -> int:
-    N: int = len(all_current)
+def get_all_num_matches(winner_masks: List[int], current_masks: List[int]) -> List[int]:
+    """Matches on every card, from the cards' masks: a popcount of an AND each."""
+    return [
+        (winner_mask & current_mask).bit_count()
+        for winner_mask, current_mask in zip(winner_masks, current_masks)
+    ]
 
-    num_cards: List[int] = [1] * N
+
+def count_scratchcards(all_num_matches: List[int]) -> int:
+    """Total cards once every card has won its copies, in O(N) however many
+    matches the cards have.
+
+    Card i adds its copies to each of the next num_matches cards. Instead of
+    adding to all of them, that is recorded as +copies where the run starts and
+    -copies just after it ends, in a difference array, and the copies won by a
+    card are the running sum of that array up to it. Runs that would go past the
+    last card are cut off there.
+    """
+    N: int = len(all_num_matches)
+
+    # changes[i]: change in the number of won copies from card i - 1 to card i
+    changes: List[int] = [0] * (N + 1)
+    won_copies: int = 0
+    total: int = 0
 
     for i in range(N):
-        num_matches: int = get_num_matches(all_winners[i], all_current[i])
+        won_copies += changes[i]
+        copies: int = 1 + won_copies
+        total += copies
 
-        for j in range(num_matches):
-            num_cards[i + j + 1] += num_cards[i]
+        num_matches: int = all_num_matches[i]
+        if num_matches:
+            changes[i + 1] += copies
+            changes[min(i + 1 + num_matches, N)] -= copies
 
-    return sum(num_cards)
+    return total
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day04.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
-    all_winners: List[List[int]] = []
-    all_current: List[List[int]] = []
+    winner_masks: List[int] = []
+    current_masks: List[int] = []
 
     for line in input_lines:
         numbers: str = line.split(": ")[1]
 
         winners, current = numbers.split(" | ")
 
-        logger.debug(f"{winners=}")
-        logger.debug(f"{current=}")
+        if __debug__:
+            logger.debug("winners={!r}", winners)
+            logger.debug("current={!r}", current)
 
-        winner_list: List[int] = [int(s) for s in winners.split(" ") if s != ""]
-        current_list: List[int] = [int(s) for s in current.split(" ") if s != ""]
+        winner_masks.append(to_mask(map(int, winners.split())))
+        current_masks.append(to_mask(map(int, current.split())))
 
-        all_winners.append(winner_list)
-        all_current.append(current_list)
+    answer: int = count_scratchcards(get_all_num_matches(winner_masks, current_masks))
+    logger.info("answer={}", answer)  # 14427616
 
-    answer: int = calc_total_scratchcards(all_winners, all_current)
-    logger.info(f"{answer=}")  # 14427616
+    return answer
 
 
 if __name__ == "__main__":
-    main()
+    time_solver(main)
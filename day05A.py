@@ -1,6 +1,7 @@
 from typing import List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -39,15 +40,13 @@ def get_min_location(
     return min(seed_attribute[-1] for seed_attribute in all_seed_attributes)
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day05.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines = read_lines(input_file)
 
     seeds = [int(s) for s in input_lines[0][len("seeds: ") :].split(" ")]
 
@@ -74,6 +73,8 @@ def main() -> None:
     answer = get_min_location(seeds, attribute_maps)
     logger.info(f"{answer=}")  # 910845529
 
+    return answer
+
 
 if __name__ == "__main__":
-    main()
+    time_solver(main)
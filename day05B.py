@@ -1,133 +1,140 @@
-import time
-from typing import List, Tuple
+import bisect
+import heapq
+import itertools
+from array import array
+from typing import Iterator, List, Optional, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG = False
 
+# find the answer with get_min_location_reverse instead of get_min_location_composed
+REVERSE_SEARCH: bool = True
 
-def get_range_diff(
-    input_range: Tuple[int, int], subsets: List[Tuple[int, int]]
-) -> List[Tuple[int, int]]:
-    """
-    Ex: given input_range = (5, 7)  (meaning numbers 5,6,7,8,9,10,11), and subsets
-    [(5, 3), (10, 1))] (meaning numbers 5,6,7,10), return
-    [(8, 2), (11, 1)] (meaning numbers 8,9,11).
 
-    Assume subsets is sorted.
+class IntervalSet:
+    """Sorted, disjoint, non-touching ranges [starts[k], ends[k]) of numbers.
+
+    A stage of get_all_attributes can split a range into many pieces, and
+    different pieces can land next to or on top of each other; merging them
+    keeps the number of ranges from growing from one stage to the next.
+    Iterating gives (start, length) tuples, like the lists of ranges it replaces.
     """
 
-    missing_ranges: List[Tuple[int, int]] = []
+    def __init__(self, starts: array, ends: array):
+        self.starts: array = starts
+        self.ends: array = ends
 
-    input_range_index = input_range[0]
-    subset_index = 0
+    @classmethod
+    def from_ranges(cls, ranges: List[Tuple[int, int]]) -> "IntervalSet":
+        starts: array = array("q")
+        ends: array = array("q")
 
-    while input_range_index < input_range[0] + input_range[1]:
-        if subset_index == len(subsets):
-            missing_ranges.append(
-                (input_range_index, input_range[0] + input_range[1] - input_range_index)
-            )
-            break
-        # ex: if 5 from (5, 7) is less than the 5 from (5, 3)
-        if input_range_index < subsets[subset_index][0]:
-            missing_ranges.append(
-                (input_range_index, subsets[subset_index][0] - input_range_index)
-            )
-            input_range_index = subsets[subset_index][0]
-        else:
-            # pre-condition that input_range_index <= current subset start range
-            # so currently, they are equal; skip this subset
-            input_range_index = subsets[subset_index][0] + subsets[subset_index][1]
-            subset_index += 1
+        for start, length in sorted(ranges):
+            if length <= 0:
+                continue
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], start + length)
+            else:
+                starts.append(start)
+                ends.append(start + length)
+
+        return cls(starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
 
-    return missing_ranges
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for start, end in zip(self.starts, self.ends):
+            yield (start, end - start)
 
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
 
-def get_single_mapped_value(input_key: int, mapping: Tuple[int, int, int]) -> int:
-    dest, source, length = mapping
 
-    if input_key in range(source, source + length):
-        return dest + (input_key - source)
+class SortedMapping:
+    """A mapping's source ranges [sources[k], ends[k]) sorted by source, with the
+    offset dest - source each of them adds, so the ranges an input range touches
+    are found with a bisect instead of checking every one of them.
+    """
+
+    def __init__(self, mapping: List[Tuple[int, int, int]]):
+        self.sources: array = array("q")
+        self.ends: array = array("q")
+        self.offsets: array = array("q")
 
-    return input_key
+        for dest, source, length in sorted(mapping, key=lambda tups: tups[1]):
+            if self.ends and source < self.ends[-1]:
+                raise ValueError(f"Source range of {(dest, source, length)} overlaps")
+            self.sources.append(source)
+            self.ends.append(source + length)
+            self.offsets.append(dest - source)
 
 
 def get_mapped_value(
-    input_range: Tuple[int, int], mapping: List[Tuple[int, int, int]]
+    input_range: Tuple[int, int], mapping: SortedMapping
 ) -> List[Tuple[int, int]]:
     """Given an input range of seed values (like for seeds [5, 12] would have input_range = (5, 7)),
     use the mapping provided to get, for instance, the soil-type ranges.
     """
 
-    logger.debug(f"get_mapped_value({input_range=})")
+    if __debug__:
+        logger.debug("get_mapped_value(input_range={})", input_range)
 
-    intersection_ranges: List[Tuple[int, int]] = []
+    start: int = input_range[0]
+    end: int = input_range[0] + input_range[1]
 
     # to be returned
     resulting_output_ranges: List[Tuple[int, int]] = []
 
-    # use each mapping to break up each input_range
-    for tups in mapping:
-        dest, source, length = tups
+    # first source range that ends after start
+    index: int = bisect.bisect_right(mapping.ends, start)
 
-        # break up input_range across mapping's source range
-        # this is mathematical range, not (start, length)
-        source_range_intersection: Tuple[int, int] = max(source, input_range[0]), min(
-            source + length, input_range[0] + input_range[1]
-        )
-
-        # has to be a valid intersection range
-        if source_range_intersection[0] >= source_range_intersection[1]:
-            continue
+    while start < end:
+        if index == len(mapping.sources) or end <= mapping.sources[index]:
+            # the rest is not in any source range, so maps to itself
+            resulting_output_ranges.append((start, end - start))
+            break
 
-        logger.debug(f"mapping={tups} resulted in {source_range_intersection}")
+        source: int = mapping.sources[index]
+        if start < source:
+            # gap before the next source range maps to itself
+            resulting_output_ranges.append((start, source - start))
+            start = source
 
-        intersection_ranges.append(
-            (
-                source_range_intersection[0],
-                source_range_intersection[1] - source_range_intersection[0],
-            )
-        )
+        piece_end: int = min(end, mapping.ends[index])
         resulting_output_ranges.append(
-            (
-                get_single_mapped_value(source_range_intersection[0], tups),
-                source_range_intersection[1] - source_range_intersection[0],
-            )
+            (start + mapping.offsets[index], piece_end - start)
         )
+        start = piece_end
+        index += 1
 
-    intersection_ranges.sort()
-
-    not_intersected: List[Tuple[int, int]] = get_range_diff(
-        input_range, intersection_ranges
-    )
-
-    logger.debug(f"{resulting_output_ranges=}")
-
-    # those not intersected, get mapped to output via identity
+    if __debug__:
+        logger.debug("resulting_output_ranges={}", resulting_output_ranges)
 
-    return resulting_output_ranges + not_intersected
+    return resulting_output_ranges
 
 
 def get_all_attributes(
     seed_ranges: List[Tuple[int, int]], mappings: List[List[Tuple[int, int, int]]]
-) -> List[List[List[Tuple[int, int]]]]:
-    all_seed_attributes: List[List[List[Tuple[int, int]]]] = [
-        [[seed_range]] for seed_range in seed_ranges
+) -> List[List[IntervalSet]]:
+    all_seed_attributes: List[List[IntervalSet]] = [
+        [IntervalSet.from_ranges([seed_range])] for seed_range in seed_ranges
     ]
     # for example, all_seed_attributes[0] would be all attribute ranges of seed_range 0.
-    # each attribute of seed_range 0 is a list of ranges
+    # each attribute of seed_range 0 is a set of ranges
 
-    for mapping in mappings:
+    for mapping in map(SortedMapping, mappings):
         for seed_index in range(len(seed_ranges)):
-            all_output_attributes = []
+            all_output_attributes: List[Tuple[int, int]] = []
             # iterate across all of the ranges in the latest attribute
             for input_range in all_seed_attributes[seed_index][-1]:
-                output_attributes: List[Tuple[int, int]] = get_mapped_value(
-                    input_range, mapping
-                )
-                all_output_attributes.extend(output_attributes)
+                all_output_attributes.extend(get_mapped_value(input_range, mapping))
 
-            all_seed_attributes[seed_index].append(all_output_attributes)
+            all_seed_attributes[seed_index].append(
+                IntervalSet.from_ranges(all_output_attributes)
+            )
 
     return all_seed_attributes
 
@@ -135,28 +142,281 @@ def get_all_attributes(
 def get_min_location(
     seed_ranges: List[Tuple[int, int]], mappings: List[List[Tuple[int, int, int]]]
 ) -> int:
-    all_seed_attributes: List[List[List[Tuple[int, int]]]] = get_all_attributes(
+    all_seed_attributes: List[List[IntervalSet]] = get_all_attributes(
         seed_ranges, mappings
     )
 
-    logger.debug(f"{all_seed_attributes=}")
+    logger.debug("all_seed_attributes={}", all_seed_attributes)
 
     return min(
-        output_ranges[0]
+        seed_all_attributes_ranges[-1].starts[0]
         for seed_all_attributes_ranges in all_seed_attributes
-        for output_ranges in seed_all_attributes_ranges[-1]
+        if seed_all_attributes_ranges[-1]
     )
 
 
-def main() -> None:
+class PiecewiseShift:
+    """Function that adds offsets[k] to every number from starts[k] up to (not
+    including) starts[k + 1]; the last piece goes on forever.
+
+    A mapping is such a function with offset dest - source over each of its
+    source ranges and offset 0 elsewhere, and so is any chain of mappings, so the
+    whole almanac composes into one PiecewiseShift. starts is sorted, starts at 0,
+    and neighboring pieces never have the same offset.
+    """
+
+    def __init__(self, starts: List[int], offsets: List[int]):
+        self.starts: List[int] = []
+        self.offsets: List[int] = []
+
+        for start, offset in zip(starts, offsets):
+            if self.offsets and self.offsets[-1] == offset:
+                continue
+            self.starts.append(start)
+            self.offsets.append(offset)
+
+    @classmethod
+    def from_mapping(cls, mapping: List[Tuple[int, int, int]]) -> "PiecewiseShift":
+        starts: List[int] = [0]
+        offsets: List[int] = [0]
+
+        for dest, source, length in sorted(mapping, key=lambda tups: tups[1]):
+            if source > starts[-1]:
+                starts.append(source)
+                offsets.append(dest - source)
+            else:
+                # the source range starts right where the last one ended
+                offsets[-1] = dest - source
+            starts.append(source + length)
+            offsets.append(0)
+
+        return cls(starts, offsets)
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[bisect.bisect_right(self.starts, value) - 1]
+
+    def then(self, after: "PiecewiseShift") -> "PiecewiseShift":
+        """The function that applies this one and then `after`."""
+        starts: List[int] = []
+        offsets: List[int] = []
+
+        for k, (start, offset) in enumerate(zip(self.starts, self.offsets)):
+            end: Optional[int] = (
+                self.starts[k + 1] if k + 1 < len(self.starts) else None
+            )
+
+            # this piece's outputs start at start + offset; split them wherever
+            # a piece of `after` begins
+            j: int = bisect.bisect_right(after.starts, start + offset) - 1
+            while True:
+                starts.append(max(start, after.starts[j] - offset))
+                offsets.append(offset + after.offsets[j])
+
+                j += 1
+                if j == len(after.starts) or (
+                    end is not None and after.starts[j] - offset >= end
+                ):
+                    break
+
+        return PiecewiseShift(starts, offsets)
+
+    def range_min(self, input_range: Tuple[int, int]) -> int:
+        """Smallest output for the numbers in input_range, given as (start, length).
+
+        Each piece is increasing, so only the first number of the range and the
+        starts of the pieces inside it can give the minimum.
+        """
+        start, length = input_range
+        k: int = bisect.bisect_right(self.starts, start) - 1
+
+        best: int = start + self.offsets[k]
+        k += 1
+        while k < len(self.starts) and self.starts[k] < start + length:
+            best = min(best, self.starts[k] + self.offsets[k])
+            k += 1
+
+        return best
+
+
+def compose_mappings(mappings: List[List[Tuple[int, int, int]]]) -> PiecewiseShift:
+    """The seed -> location function of a whole almanac, as one PiecewiseShift."""
+    composed: PiecewiseShift = PiecewiseShift([0], [0])
+    for mapping in mappings:
+        composed = composed.then(PiecewiseShift.from_mapping(mapping))
+
+    return composed
+
+
+def get_min_location_composed(
+    seed_ranges: List[Tuple[int, int]], mappings: List[List[Tuple[int, int, int]]]
+) -> int:
+    """get_min_location, by composing the almanac once and then looking up each
+    seed range with a binary search, instead of mapping ranges stage by stage.
+    """
+    seed_to_location: PiecewiseShift = compose_mappings(mappings)
+
+    return min(seed_to_location.range_min(seed_range) for seed_range in seed_ranges)
+
+
+# end of the last piece of a mapping, which goes on forever: past any almanac number
+NO_END: int = 1 << 80
+
+
+def invert_mapping(mapping: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    """A mapping's pieces as (first output, end of outputs, offset), for pulling
+    outputs back to inputs, sorted by first output. The last piece ends at NO_END.
+
+    Mappings are not one-to-one (a number left alone by the mapping can also be
+    the destination of some source range), so an output can have several inputs.
+    """
+    shift: PiecewiseShift = PiecewiseShift.from_mapping(mapping)
+
+    inverted: List[Tuple[int, int, int]] = []
+    for k, (start, offset) in enumerate(zip(shift.starts, shift.offsets)):
+        end: int = shift.starts[k + 1] if k + 1 < len(shift.starts) else NO_END
+        inverted.append((start + offset, end + offset, offset))
+
+    return sorted(inverted)
+
+
+class InvertedMapping:
+    """A mapping run backwards, from outputs to the inputs that reach them.
+
+    The inverted pieces can overlap, so they are dealt into layers of pieces
+    that do not overlap each other (usually two: the shifted source ranges, and
+    the numbers left alone), and each layer is searched by bisecting on firsts.
+    """
+
+    def __init__(self, mapping: List[Tuple[int, int, int]]):
+        # per layer: firsts, ends and offsets of its pieces, sorted by first
+        self.layers: List[Tuple[List[int], List[int], List[int]]] = []
+
+        for first, end, offset in invert_mapping(mapping):
+            for firsts, ends, offsets in self.layers:
+                if ends[-1] <= first:
+                    break
+            else:
+                firsts, ends, offsets = [], [], []
+                self.layers.append((firsts, ends, offsets))
+
+            firsts.append(first)
+            ends.append(end)
+            offsets.append(offset)
+
+    def inputs(self, output: int) -> List[int]:
+        """Every input that the mapping sends to `output`."""
+        values: List[int] = []
+
+        for firsts, ends, offsets in self.layers:
+            index: int = bisect.bisect_right(firsts, output) - 1
+            if index >= 0 and output < ends[index]:
+                values.append(output - offsets[index])
+
+        return values
+
+    def pieces(self, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+        """The outputs from start up to end, cut where the pieces they come from
+        change, as (first output, end of outputs, offset) triples.
+        """
+        for firsts, ends, offsets in self.layers:
+            index: int = max(bisect.bisect_right(firsts, start) - 1, 0)
+
+            while index < len(firsts) and firsts[index] < end:
+                if ends[index] > start:
+                    yield (
+                        max(firsts[index], start),
+                        min(ends[index], end),
+                        offsets[index],
+                    )
+                index += 1
+
+
+def pull_back(value: int, inverted_mappings: List[InvertedMapping]) -> List[int]:
+    """Every input that the chain of mappings sends to `value`."""
+    values: List[int] = [value]
+
+    for inverted in reversed(inverted_mappings):
+        values = [value for output in values for value in inverted.inputs(output)]
+
+    return values
+
+
+def get_min_location_reverse(
+    seed_ranges: List[Tuple[int, int]], mappings: List[List[Tuple[int, int, int]]]
+) -> int:
+    """get_min_location, searching upwards from the smallest locations instead.
+
+    Locations are pulled back through the inverted mappings a range at a time:
+    a range is cut wherever the previous stage's pieces change, until it
+    reaches seed numbers. The ranges wait in a heap ordered by their first
+    location, so the search always works on the smallest locations left. The
+    first location found to come from a seed is then the answer, and larger
+    locations are never pulled back.
+    """
+    inverted_mappings: List[InvertedMapping] = [
+        InvertedMapping(mapping) for mapping in mappings
+    ]
+
+    sorted_seed_ranges: List[Tuple[int, int]] = sorted(seed_ranges)
+    seed_starts: List[int] = [start for start, _ in sorted_seed_ranges]
+    # longest reach of the seed ranges up to each one, as ranges may overlap
+    seed_ends: List[int] = list(
+        itertools.accumulate(
+            (start + length for start, length in sorted_seed_ranges), max
+        )
+    )
+
+    def first_seed_from(value: int) -> Optional[int]:
+        """Smallest seed at least value."""
+        index: int = bisect.bisect_right(seed_starts, value) - 1
+        if index >= 0 and value < seed_ends[index]:
+            return value
+        if index + 1 < len(seed_starts):
+            return seed_starts[index + 1]
+        return None
+
+    # (first location, end of locations, offset, stage): locations whose numbers
+    # are location - offset before the mappings after `stage`. A stage of -1
+    # means the numbers are seeds, and FOUND marks a location known to be reached
+    FOUND: int = -2
+    heap: List[Tuple[int, int, int, int]] = [(0, NO_END, 0, len(mappings) - 1)]
+
+    while heap:
+        first, end, offset, stage = heapq.heappop(heap)
+
+        if stage == FOUND:
+            return first
+
+        if stage == -1:
+            seed: Optional[int] = first_seed_from(first - offset)
+            if seed is not None and seed + offset < end:
+                heapq.heappush(heap, (seed + offset, seed + offset + 1, 0, FOUND))
+            continue
+
+        inverted: InvertedMapping = inverted_mappings[stage]
+        for piece_first, piece_end, piece_offset in inverted.pieces(
+            first - offset, end - offset
+        ):
+            heapq.heappush(
+                heap,
+                (
+                    piece_first + offset,
+                    piece_end + offset,
+                    offset + piece_offset,
+                    stage - 1,
+                ),
+            )
+
+    raise ValueError("No seed reaches any location")
+
+
+def main() -> int:
     input_file = "inputs/day05.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines = read_lines(input_file)
 
     seeds = [int(s) for s in input_lines[0][len("seeds: ") :].split(" ")]
     seed_ranges: List[Tuple[int, int]] = [
@@ -180,15 +440,17 @@ def main() -> None:
             nums = [int(s) for s in line.split(" ")]
             attribute_maps[-1].append((nums[0], nums[1], nums[2]))
 
-    logger.debug(f"{seeds=}")
-    logger.debug(f"{attribute_maps}")
+    logger.debug("seeds={}", seeds)
+    logger.debug("{}", attribute_maps)
 
-    answer = get_min_location(seed_ranges, attribute_maps)
+    if REVERSE_SEARCH:
+        answer = get_min_location_reverse(seed_ranges, attribute_maps)
+    else:
+        answer = get_min_location_composed(seed_ranges, attribute_maps)
     logger.info(f"{answer=}")  # 77435348
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,34 +1,53 @@
-import time
-from typing import List
+import math
+from typing import Iterable, List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
 
 def calc_num_ways_to_win_race(time: int, best_distance: int) -> int:
-    num_ways: int = 0
-    for i in range(time + 1):
-        time_pressing: int = i
-        time_going: int = time - time_pressing
-
-        distance: int = time_pressing * time_going
-
-        if distance > best_distance:
-            num_ways += 1
-
-    return num_ways
+    """Number of x in [0, time] with x * (time - x) > best_distance, exactly.
+
+    The winners are the integers strictly between the roots of
+    x^2 - time * x + best_distance, (time +- sqrt(time^2 - 4 * best_distance)) / 2.
+    math.isqrt gives the square root without floats, so this holds for numbers of
+    any size; the first winner it suggests is then nudged by a step or two,
+    which also handles roots that land exactly on an integer (a tie is not a win).
+    Winners are symmetric about time / 2, so the last one is time - first.
+    """
+    if best_distance < 0:
+        return time + 1
+
+    # the farthest any press goes, at the middle of the race
+    half: int = time // 2
+    if half * (time - half) <= best_distance:
+        return 0
+
+    first: int = max(0, (time - math.isqrt(time * time - 4 * best_distance)) // 2)
+    while first * (time - first) <= best_distance:
+        first += 1
+    while first > 0 and (first - 1) * (time - first + 1) > best_distance:
+        first -= 1
+
+    return time - 2 * first + 1
+
+
+def calc_num_ways_to_win_races(races: Iterable[Tuple[int, int]]) -> List[int]:
+    """calc_num_ways_to_win_race for each (time, best distance) pair."""
+    return [
+        calc_num_ways_to_win_race(time, best_distance) for time, best_distance in races
+    ]
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day06.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     times: List[int] = [
         int(s) for s in input_lines[0][len("Time:") :].split(" ") if s != ""
@@ -37,15 +56,12 @@ def main() -> None:
         int(s) for s in input_lines[1][len("Distance:") :].split(" ") if s != ""
     ]
 
-    answer: int = 1
-    for race in range(len(times)):
-        answer *= calc_num_ways_to_win_race(times[race], distances[race])
+    answer: int = math.prod(calc_num_ways_to_win_races(zip(times, distances)))
 
     logger.info(f"{answer=}")  # 861300
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
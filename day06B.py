@@ -1,34 +1,46 @@
 import math
-import time
 from typing import List
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
 
 def calc_num_ways_to_win_race(time: int, best_distance: int) -> int:
-    # find number of x satisfy 0 <= x <= time and x * (time - x) > best_distance. Well best_distance > 0 so first condition is implied by second.
-    # x^2 - time * x + best_distance < 0
-    # r1 <= x <= r2 where r1, r2 = (time +- sqrt(time^2 - 4*best_distance)) / 2
+    """Number of x in [0, time] with x * (time - x) > best_distance, exactly.
 
-    r1: int = int(math.ceil((time - math.sqrt(time**2 - 4 * best_distance)) / 2))
-    r2: int = int(math.floor((time + math.sqrt(time**2 - 4 * best_distance)) / 2))
+    The winners are the integers strictly between the roots of
+    x^2 - time * x + best_distance, (time +- sqrt(time^2 - 4 * best_distance)) / 2.
+    math.isqrt gives the square root without floats, so this holds for numbers of
+    any size; the first winner it suggests is then nudged by a step or two,
+    which also handles roots that land exactly on an integer (a tie is not a win).
+    Winners are symmetric about time / 2, so the last one is time - first.
+    """
+    if best_distance < 0:
+        return time + 1
 
-    logger.debug(f"{r1=} {r2=}")
+    # the farthest any press goes, at the middle of the race
+    half: int = time // 2
+    if half * (time - half) <= best_distance:
+        return 0
 
-    return r2 - r1 + 1
+    first: int = max(0, (time - math.isqrt(time * time - 4 * best_distance)) // 2)
+    while first * (time - first) <= best_distance:
+        first += 1
+    while first > 0 and (first - 1) * (time - first + 1) > best_distance:
+        first -= 1
 
+    return time - 2 * first + 1
 
-def main() -> None:
+
+def main() -> int:
     input_file: str = "inputs/day06.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     time = int(input_lines[0][len("Time:") :].replace(" ", ""))
     distance = int(input_lines[1][len("Distance:") :].replace(" ", ""))
@@ -39,9 +51,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 28101347
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
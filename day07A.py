@@ -1,9 +1,8 @@
-import time
 from collections import Counter
-from functools import cmp_to_key
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -34,47 +33,35 @@ def get_hand_type(hand: str) -> int:
     return 6
 
 
-def compare_number(a: str, b: str) -> int:
-    alphabet = "23456789TJQKA"
+# rank of each card, from 0 for "2" up to 12 for "A"
+CARD_RANKS: Dict[str, int] = {card: rank for rank, card in enumerate("23456789TJQKA")}
 
-    for i in range(len(a)):
-        r1 = alphabet.find(a[i])
-        r2 = alphabet.find(b[i])
 
-        if r1 != r2:
-            return r1 - r2
+def hand_key(hand: str) -> int:
+    """Sort key of a hand: its type, then its cards' ranks as five base-13 digits,
+    so comparing keys compares hands (type first, then card by card).
+    """
+    key: int = get_hand_type(hand)
+    for card in hand:
+        key = key * 13 + CARD_RANKS[card]
 
-    return 0
-
-
-def compare_hands(hand1: Tuple[str, int], hand2: Tuple[str, int]) -> int:
-    hand_type_1 = get_hand_type(hand1[0])
-    hand_type_2 = get_hand_type(hand2[0])
-
-    #  logger.debug(f'hand_type of {hand1[0]} = {hand_type_1}')
-    #  logger.debug(f'hand_type of {hand2[0]} = {hand_type_2}')
-
-    if hand_type_1 == hand_type_2:
-        return compare_number(hand1[0], hand2[0])
-
-    return hand_type_1 - hand_type_2
+    return key
 
 
 def sorted_inputs(inputs: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
-    sorted_list = sorted(inputs, key=cmp_to_key(compare_hands))
+    # each hand is keyed once, instead of typed again in every comparison
+    sorted_list = sorted(inputs, key=lambda hand: hand_key(hand[0]))
 
     return sorted_list
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day07.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     inputs: List[Tuple[str, int]] = []
     for line in input_lines:
@@ -91,9 +78,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 248836197
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
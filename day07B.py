@@ -1,9 +1,9 @@
-import time
+import itertools
 from collections import Counter
-from functools import cmp_to_key
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -34,83 +34,69 @@ def get_raw_hand_type(hand: str) -> int:
     return 6
 
 
-def get_hand_type_while_interpreting_j(hand: str) -> int:
-    def generate_all_candidates(hand: str) -> List[str]:
-        """Interpret J as any character."""
-        j_replacement: str = "23456789TQKA"
-
-        def helper(
-            chars: List[str], original_hand: str, accumulator: List[str]
-        ) -> None:
-            if len(chars) == 5:
-                accumulator.append("".join(chars))
-                return
-
-            current_index: int = len(chars)
-
-            if original_hand[current_index] != "J":
-                chars.append(original_hand[current_index])
-                helper(chars, original_hand, accumulator)
-                chars.pop()
-            else:
-                for replacement_char in j_replacement:
-                    chars.append(replacement_char)
-                    helper(chars, original_hand, accumulator)
-                    chars.pop()
+def get_signature_types() -> Dict[Tuple[int, ...], int]:
+    """Hand type of each signature: the sorted (largest first) counts of a hand's
+    cards. Hands of five cards drawn from five kinds have every signature.
+    """
+    signature_types: Dict[Tuple[int, ...], int] = {}
 
-        accumulator: List[str] = []
-        helper([], hand, accumulator)
+    for cards in itertools.combinations_with_replacement("AKQT9", 5):
+        hand: str = "".join(cards)
+        signature: Tuple[int, ...] = tuple(sorted(Counter(hand).values(), reverse=True))
+        signature_types[signature] = get_raw_hand_type(hand)
 
-        return accumulator
+    return signature_types
 
-    all_replacements = generate_all_candidates(hand)
 
-    return max(
-        get_raw_hand_type(hand_replacement) for hand_replacement in all_replacements
-    )
+SIGNATURE_TYPES: Dict[Tuple[int, ...], int] = get_signature_types()
 
 
-def compare_number(a: str, b: str) -> int:
-    alphabet = "J23456789TQKA"
+def get_hand_type_while_interpreting_j(hand: str) -> int:
+    """Best type of the hand when each J can stand for any other card.
 
-    for i in range(len(a)):
-        r1 = alphabet.find(a[i])
-        r2 = alphabet.find(b[i])
+    Jokers do the most good as copies of the most common other card: that turns
+    a pair into three of a kind, two pair into a full house, and so on, and no
+    other choice gives a better type.
+    """
+    num_jokers: int = hand.count("J")
+    if num_jokers == 5:
+        return 6
 
-        if r1 != r2:
-            return r1 - r2
+    counts: List[int] = sorted(Counter(hand.replace("J", "")).values(), reverse=True)
+    counts[0] += num_jokers
 
-    return 0
+    return SIGNATURE_TYPES[tuple(counts)]
 
 
-def compare_hands(hand1: Tuple[str, int], hand2: Tuple[str, int]) -> int:
-    hand_type_1 = get_hand_type_while_interpreting_j(hand1[0])
-    hand_type_2 = get_hand_type_while_interpreting_j(hand2[0])
+# rank of each card, from 0 for "J" (now the weakest) up to 12 for "A"
+CARD_RANKS: Dict[str, int] = {card: rank for rank, card in enumerate("J23456789TQKA")}
 
-    #  logger.debug(f'hand_type of {hand1[0]} = {hand_type_1}')
-    #  logger.debug(f'hand_type of {hand2[0]} = {hand_type_2}')
 
-    if hand_type_1 == hand_type_2:
-        return compare_number(hand1[0], hand2[0])
+def hand_key(hand: str) -> int:
+    """Sort key of a hand: its type, then its cards' ranks as five base-13 digits,
+    so comparing keys compares hands (type first, then card by card).
+    """
+    key: int = get_hand_type_while_interpreting_j(hand)
+    for card in hand:
+        key = key * 13 + CARD_RANKS[card]
 
-    return hand_type_1 - hand_type_2
+    return key
 
 
 def sorted_inputs(inputs: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
-    sorted_list = sorted(inputs, key=cmp_to_key(compare_hands))
+    # each hand is keyed once, instead of typed again in every comparison
+    sorted_list = sorted(inputs, key=lambda hand: hand_key(hand[0]))
 
     return sorted_list
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day07.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     inputs: List[Tuple[str, int]] = []
     for line in input_lines:
@@ -127,9 +113,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 251195607
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
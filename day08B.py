@@ -1,7 +1,7 @@
-import time
 from typing import Dict, List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -84,15 +84,13 @@ def calc_shortest_path(
     return answer
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day08.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     lr_instructions: str = input_lines[0]
 
@@ -108,9 +106,8 @@ def main() -> None:
 
     # 13,740,108,158,591
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,7 +1,7 @@
-import time
 from typing import List
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG = False
 
@@ -29,15 +29,13 @@ def calc_next(seq: List[int]) -> int:
     return all_diffs[0][-1]
 
 
-def main() -> None:
+def main() -> int:
     input_file = "inputs/day09.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines = read_lines(input_file)
 
     answer: int = 0
     for line in input_lines:
@@ -45,9 +43,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 1934898178
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
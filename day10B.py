@@ -1,7 +1,7 @@
-import time
 from typing import Dict, List, Tuple
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
 
 DEBUG: bool = False
 
@@ -26,10 +26,10 @@ def get_potential_neighbors(
     return [(row + dx, col + dy) for dx, dy in changes]
 
 
-def verify_connection(board: List[List[str]], start_row: int, start_col: int) -> bool:
-    current: str = board[start_row][start_col]
-    R: int = len(board)
-    C: int = len(board)
+def verify_connection(board: Grid, start_row: int, start_col: int) -> bool:
+    current: str = board[start_row, start_col]
+    R: int = board.rows
+    C: int = board.cols
 
     num_matching: int = 0
 
@@ -37,39 +37,39 @@ def verify_connection(board: List[List[str]], start_row: int, start_col: int) ->
     if (
         current in {"|", "L", "J"}
         and valid(start_row - 1, start_col, R, C)
-        and board[start_row - 1][start_col] in {"|", "F", "7"}
+        and board[start_row - 1, start_col] in {"|", "F", "7"}
     ):
         num_matching += 1
     # points right
     if (
         current in {"-", "L", "F"}
         and valid(start_row, start_col + 1, R, C)
-        and board[start_row][start_col + 1] in {"-", "7", "J"}
+        and board[start_row, start_col + 1] in {"-", "7", "J"}
     ):
         num_matching += 1
     # points left
     if (
         current in {"-", "7", "J"}
-        and valid(start_row, start_col + 1, R, C)
-        and board[start_row][start_col - 1] in {"-", "L", "F"}
+        and valid(start_row, start_col - 1, R, C)
+        and board[start_row, start_col - 1] in {"-", "L", "F"}
     ):
         num_matching += 1
     # points down
     if (
         current in {"|", "F", "7"}
-        and valid(start_row, start_col + 1, R, C)
-        and board[start_row + 1][start_col] in {"|", "L", "J"}
+        and valid(start_row + 1, start_col, R, C)
+        and board[start_row + 1, start_col] in {"|", "L", "J"}
     ):
         num_matching += 1
 
     return num_matching == 2
 
 
-def dfs_distances(
-    board: List[List[str]], start_row: int, start_col: int
-) -> List[List[int]]:
-    R: int = len(board)
-    C: int = len(board[0])
+def dfs_distances(board: Grid, start_row: int, start_col: int) -> List[List[int]]:
+    R: int = board.rows
+    C: int = board.cols
+    # rows as strings, so cells are read without Grid's bounds checks
+    lines: List[str] = [board.row(row).decode() for row in range(R)]
 
     visited: List[List[bool]] = [[False] * C for row in range(R)]
     distances: List[List[int]] = [[R * C + 1] * C for row in range(R)]
@@ -85,11 +85,11 @@ def dfs_distances(
         visited[curr_row][curr_col] = True
 
         for neighbor_row, neighbor_col in get_potential_neighbors(
-            board[curr_row][curr_col], curr_row, curr_col
+            lines[curr_row][curr_col], curr_row, curr_col
         ):
             if (
                 valid(neighbor_row, neighbor_col, R, C)
-                and board[neighbor_row][neighbor_col] != "."
+                and lines[neighbor_row][neighbor_col] != "."
                 and not visited[neighbor_row][neighbor_col]
             ):
                 distances[neighbor_row][neighbor_col] = min(
@@ -111,9 +111,9 @@ def dfs_distances(
     return distances
 
 
-def find_loop_inner_area(board: List[List[str]], start_row: int, start_col: int) -> int:
+def find_loop_inner_area(board: Grid, start_row: int, start_col: int) -> int:
     for s in neighbor_map:
-        board[start_row][start_col] = s
+        board[start_row, start_col] = s
         logger.debug(f"Try using {s=}")
 
         if not verify_connection(board, start_row, start_col):
@@ -133,14 +133,13 @@ def find_loop_inner_area(board: List[List[str]], start_row: int, start_col: int)
     for row in range(len(distances) - 1):
         # outer-most border is always exterior
         inside: bool = False
+        cells: bytes = board.row(row)
 
         for col in range(len(distances[row]) - 1):
             if distances[row][col] > -1:
-                curr: str = board[row][col]
-
                 # toggle if square is inside or outside by determining
                 # if top-left corner points down
-                if curr in {"|", "7", "F"}:
+                if cells[col] in b"|7F":
                     inside = not inside
             if inside:
                 #  logger.debug(f'Adding area on {row=}, {col=}')
@@ -151,11 +150,11 @@ def find_loop_inner_area(board: List[List[str]], start_row: int, start_col: int)
     # get length of border
     border_length: int = 0
     for neighbor_row, neighbor_col in get_potential_neighbors(
-        board[start_row][start_col], start_row, start_col
+        board[start_row, start_col], start_row, start_col
     ):
         if (
-            valid(neighbor_row, neighbor_col, len(board), len(board[0]))
-            and board[neighbor_row][neighbor_col] != "."
+            board.in_bounds(neighbor_row, neighbor_col)
+            and board[neighbor_row, neighbor_col] != "."
         ):
             border_length = max(
                 border_length, 1 + distances[neighbor_row][neighbor_col]
@@ -167,38 +166,22 @@ def find_loop_inner_area(board: List[List[str]], start_row: int, start_col: int)
     return area + 1 - (border_length // 2)
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day10.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    board: Grid = Grid.from_file(input_file)
 
-    board: List[List[str]] = [[c for c in line] for line in input_lines]
-
-    start_row: int = -1
-    start_col: int = -1
-
-    for i in range(len(board)):
-        for j in range(len(board[i])):
-            if board[i][j] == "S":
-                start_row = i
-                start_col = j
-                break
-
-        if start_row != -1:
-            break
+    start_row, start_col = board.find("S")
 
     answer: int = find_loop_inner_area(board, start_row, start_col)
 
     logger.info(f"{answer=}")  # 415
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
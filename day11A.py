@@ -1,7 +1,7 @@
-import time
 from typing import List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -107,22 +107,19 @@ def find_sum_of_dist_between_every_two_galaxies(universe: List[str]) -> int:
     return total_dist
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day11.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     answer: int = find_sum_of_dist_between_every_two_galaxies(input_lines)
     logger.info(f"{answer=}")  # 9370588
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,7 +1,7 @@
-import time
 from typing import List
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -73,15 +73,13 @@ def try_all_possible_combinations(row: List[str], desired_groups: List[int]):
     return num_good_combinations
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/day12.txt"
 
     if DEBUG:
         input_file = "inputs/dummy.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     answer: int = 0
 
@@ -94,9 +92,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 7017
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,7 +1,8 @@
-import time
 from typing import List, Optional
 
-from loguru import logger
+from log import logger, time_solver
+from profiler import profiled
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -11,8 +12,6 @@ UNKNOWN: str = "?"
 
 INPUT_MULTIPLIER: int = 5
 
-num_times_called_recursive_function: int = 0
-
 
 def group_up_completed(row: List[str]) -> List[int]:
     """Given row of springs, count up the groups of damaged springs."""
@@ -85,7 +84,8 @@ def try_all_possible_combinations(row: List[str], desired_groups: List[int]) ->
     and there are still j damaged springs to fill
     and row[i-1] is an undamaged spring (or i == 0) if k == 0, else row[i-1] is a damaged spring if k == 1
     """
-    logger.info(f"\n{row=} and {desired_groups=}")
+    if __debug__:
+        logger.debug("\nrow={} and desired_groups={}", row, desired_groups)
     num_damaged_springs_left: int = sum(desired_groups) - len(
         [i for i, v in enumerate(row) if v == DAMAGED_SPRING]
     )
@@ -96,6 +96,7 @@ def try_all_possible_combinations(row: List[str], desired_groups: List[int]) ->
         for j in range(len(row))
     ]
 
+    @profiled
     def fill_in_one_position(
         row: List[str],
         row_index: int,
@@ -105,9 +106,6 @@ def try_all_possible_combinations(row: List[str], desired_groups: List[int]) ->
         """Recursive function that finds how many ways to fill in row from row_index onwards by changing the remaining
         '?' blocks to '#' or '.' such that it fits desired_groups.
         """
-        global num_times_called_recursive_function
-        num_times_called_recursive_function += 1
-
         if num_damaged_springs_left < 0:
             return 0
         if row_index == len(row):
@@ -172,17 +170,15 @@ def try_all_possible_combinations(row: List[str], desired_groups: List[int]) ->
     return answer
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day12.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     answer: int = 0
 
     for index, line in enumerate(input_lines):
-        logger.info(f"Starting computation of line #{1 + index}")
+        logger.info("Starting computation of line #{}", 1 + index)
         parts: List[str] = line.split(" ")
         row = [s for s in "?".join([parts[0]] * INPUT_MULTIPLIER)]
         desired_groups: List[int] = [
@@ -193,16 +189,13 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 527570479489
 
-    logger.info(f"{num_times_called_recursive_function=}")
-
     #  answer=527570479489
-    #  num_times_called_recursive_function=820053
+    #  fill_in_one_position is called 820053 times (run with AOC_PROFILE=1 to count)
 
     # that is, 527,570,479,489
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    logger.info(f"Took {time.time() - start_time}")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,20 +1,15 @@
-import time
 from typing import List
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
 
-def transpose(board: List[List[str]]) -> List[List[str]]:
-    return [
-        [board[row][col] for row in range(len(board))] for col in range(len(board[0]))
-    ]
-
-
-def find_horizontal_reflections(board: List[List[str]]) -> List[int]:
+def find_horizontal_reflections(board: Grid) -> List[int]:
     answer: List[int] = []
-    R: int = len(board)
+    R: int = board.rows
 
     for i in range(1, R):
         valid_reflection = True
@@ -24,7 +19,7 @@ def find_horizontal_reflections(board: List[List[str]]) -> List[int]:
             row2: int = sum_of_rows - row
 
             if 0 <= row2 < R:
-                if board[row] != board[row2]:
+                if board.row(row) != board.row(row2):
                     valid_reflection = False
                     break
 
@@ -34,30 +29,28 @@ def find_horizontal_reflections(board: List[List[str]]) -> List[int]:
     return answer
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day13.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
-    boards: List[List[List[str]]] = []
+    boards: List[Grid] = []
 
-    current_board: List[List[str]] = []
+    current_board: List[str] = []
     for line in input_lines:
         if line == "":
-            boards.append(current_board)
+            boards.append(Grid.from_lines(current_board))
             current_board = []
         else:
-            current_board.append([s for s in line])
+            current_board.append(line)
 
-    boards.append(current_board)
+    boards.append(Grid.from_lines(current_board))
 
     horizontal_reflections: List[List[int]] = [
         find_horizontal_reflections(board) for board in boards
     ]
     vertical_reflections: List[List[int]] = [
-        find_horizontal_reflections(transpose(board)) for board in boards
+        find_horizontal_reflections(board.transpose()) for board in boards
     ]
 
     answer: int = 100 * sum([sum(indv) for indv in horizontal_reflections]) + sum(
@@ -66,11 +59,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 39939
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
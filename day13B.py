@@ -1,23 +1,22 @@
-import time
 from typing import List, Set, Tuple
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
 
-def transpose(board: List[List[str]]) -> List[List[str]]:
-    return [
-        [board[row][col] for row in range(len(board))] for col in range(len(board[0]))
-    ]
-
-
-def find_horizontal_reflections(board: List[List[str]]) -> List[int]:
+def find_horizontal_reflections(board: Grid) -> List[int]:
     answer: Set[int] = set()
-    R: int = len(board)
+    R: int = board.rows
+
+    # rows are compared many times for each smudge, so compare copies of them and
+    # clean the smudge in the copy of its row
+    rows: List[bytes] = [board.row(row) for row in range(R)]
 
     def is_valid_horizontal_reflection(
-        board: List[List[str]], reflection_row: int, changed: Tuple[int, int]
+        rows: List[bytes], reflection_row: int, changed: Tuple[int, int]
     ) -> bool:
         sum_of_rows: int = 2 * reflection_row - 1
 
@@ -25,7 +24,7 @@ def find_horizontal_reflections(board: List[List[str]]) -> List[int]:
             row2: int = sum_of_rows - row
 
             if 0 <= row2 < R:
-                if board[row] != board[row2]:
+                if rows[row] != rows[row2]:
                     return False
 
         # there has to be a smudge on the mirror; so smudge has to be reflected / have
@@ -37,47 +36,48 @@ def find_horizontal_reflections(board: List[List[str]]) -> List[int]:
         return True
 
     for row in range(R):
-        for col in range(len(board[row])):
-            old_char: str = board[row][col]
-            board[row][col] = "#" if old_char == "." else "."
+        original_row: bytes = rows[row]
+
+        for col in range(board.cols):
+            old_char: str = board[row, col]
+            new_char: str = "#" if old_char == "." else "."
+            rows[row] = original_row[:col] + new_char.encode() + original_row[col + 1 :]
 
             for i in range(1, R):
-                if is_valid_horizontal_reflection(board, i, (row, col)):
+                if is_valid_horizontal_reflection(rows, i, (row, col)):
                     logger.debug(
-                        f"By switching board[{row}][{col}] from {old_char} to {board[row][col]}, got reflection at row {i}"
+                        f"By switching board[{row}][{col}] from {old_char} to {new_char}, got reflection at row {i}"
                     )
 
                     answer.add(i)
 
-            board[row][col] = old_char
+        rows[row] = original_row
 
     return list(answer)
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day13.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
-    boards: List[List[List[str]]] = []
+    boards: List[Grid] = []
 
-    current_board: List[List[str]] = []
+    current_board: List[str] = []
     for line in input_lines:
         if line == "":
-            boards.append(current_board)
+            boards.append(Grid.from_lines(current_board))
             current_board = []
         else:
-            current_board.append([s for s in line])
+            current_board.append(line)
 
-    boards.append(current_board)
+    boards.append(Grid.from_lines(current_board))
 
     horizontal_reflections: List[List[int]] = [
         find_horizontal_reflections(board) for board in boards
     ]
     vertical_reflections: List[List[int]] = [
-        find_horizontal_reflections(transpose(board)) for board in boards
+        find_horizontal_reflections(board.transpose()) for board in boards
     ]
 
     answer: int = 100 * sum([sum(indv) for indv in horizontal_reflections]) + sum(
@@ -86,11 +86,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 32069
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
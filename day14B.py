@@ -1,126 +1,135 @@
-import time
-from typing import Dict, List
+from typing import Dict, Optional
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
 
 DEBUG: bool = False
 
-ROUND: str = "O"
-SQUARE: str = "#"
-EMPTY: str = "."
+ROUND: bytes = b"O"
+SQUARE: bytes = b"#"
+EMPTY: bytes = b"."
 
 NUM_CYCLES: int = 1_000_000_000
 
 
-def calc_north_load(board: List[List[str]]) -> int:
-    R: int = len(board)
-    C: int = len(board[0])
+def calc_north_load(board: Grid) -> int:
+    R: int = board.rows
 
-    answer: int = 0
+    # every round stone in a row has the same load
+    return sum((R - row) * board.row(row).count(ROUND) for row in range(R))
 
-    for col in range(C):
-        round_final_positions: List[int] = []
 
-        for row in range(R):
-            if board[row][col] == ROUND:
-                round_final_positions.append(row)
+class RolledSegments(dict):
+    """Cache from a segment of cells between square stones to that segment with its
+    round stones rolled to one end. They all end up packed against that end, so a
+    segment is rebuilt from its count of round stones.
+    """
 
-        # convert row positions into load weight
-        answer += sum(R - row for row in round_final_positions)
+    def __init__(self, toward_start: bool):
+        super().__init__()
+        self.toward_start: bool = toward_start
 
-    return answer
+    def __missing__(self, segment: bytes) -> bytes:
+        num_round: int = segment.count(ROUND)
+        rounds: bytes = ROUND * num_round
+        empties: bytes = EMPTY * (len(segment) - num_round)
 
+        rolled: bytes = rounds + empties if self.toward_start else empties + rounds
+        self[segment] = rolled
+        return rolled
 
-def tilt_north(board: List[List[str]]) -> List[List[str]]:
-    R: int = len(board)
-    C: int = len(board[0])
 
-    for col in range(C):
-        next_final_position: int = 0  # row of next round stone when rolled north
+def roll(line: bytes, rolled_segments: RolledSegments) -> bytes:
+    """Roll the round stones in a line of cells the way `rolled_segments` rolls them.
 
-        for row in range(R):
-            if board[row][col] == SQUARE:
-                next_final_position = row + 1
-            elif board[row][col] == ROUND:
-                board[row][col] = EMPTY
-                board[next_final_position][col] = ROUND
-                next_final_position += 1
+    Square stones split the line into segments that roll on their own. The same
+    segments come back cycle after cycle, so with a cache kept across cycles
+    nearly all of them are hits and a line is rolled in one pass without a Python
+    loop over its segments.
+    """
+    return SQUARE.join(map(rolled_segments.__getitem__, line.split(SQUARE)))
 
-    return board
 
+def tilt_north(board: Grid, rolled_segments: Optional[RolledSegments] = None) -> Grid:
+    if rolled_segments is None:
+        rolled_segments = RolledSegments(True)
+
+    for col in range(board.cols):
+        board.data[col :: board.cols] = roll(board.column(col), rolled_segments)
+
+    return board
 
-def tilt_south(board: List[List[str]]) -> List[List[str]]:
-    R: int = len(board)
-    C: int = len(board[0])
 
-    for col in range(C):
-        next_final_position: int = R - 1  # row of next round stone when rolled south
+def tilt_south(board: Grid, rolled_segments: Optional[RolledSegments] = None) -> Grid:
+    if rolled_segments is None:
+        rolled_segments = RolledSegments(False)
 
-        for row in range(R - 1, -1, -1):
-            if board[row][col] == SQUARE:
-                next_final_position = row - 1
-            elif board[row][col] == ROUND:
-                board[row][col] = EMPTY
-                board[next_final_position][col] = ROUND
-                next_final_position -= 1
+    for col in range(board.cols):
+        board.data[col :: board.cols] = roll(board.column(col), rolled_segments)
 
     return board
 
 
-def tilt_west(board: List[List[str]]) -> List[List[str]]:
-    R: int = len(board)
-    C: int = len(board[0])
+def tilt_west(board: Grid, rolled_segments: Optional[RolledSegments] = None) -> Grid:
+    if rolled_segments is None:
+        rolled_segments = RolledSegments(True)
 
-    for row in range(R):
-        next_final_position: int = 0  # col of next round stone when rolled west
+    C: int = board.cols
 
-        for col in range(C):
-            if board[row][col] == SQUARE:
-                next_final_position = col + 1
-            elif board[row][col] == ROUND:
-                board[row][col] = EMPTY
-                board[row][next_final_position] = ROUND
-                next_final_position += 1
+    for row in range(board.rows):
+        board.data[row * C : (row + 1) * C] = roll(board.row(row), rolled_segments)
 
     return board
 
 
-def tilt_east(board: List[List[str]]) -> List[List[str]]:
-    R: int = len(board)
-    C: int = len(board[0])
+def tilt_east(board: Grid, rolled_segments: Optional[RolledSegments] = None) -> Grid:
+    if rolled_segments is None:
+        rolled_segments = RolledSegments(False)
 
-    for row in range(R):
-        next_final_position: int = C - 1  # col of next round stone when rolled east
+    C: int = board.cols
 
-        for col in range(C - 1, -1, -1):
-            if board[row][col] == SQUARE:
-                next_final_position = col - 1
-            elif board[row][col] == ROUND:
-                board[row][col] = EMPTY
-                board[row][next_final_position] = ROUND
-                next_final_position -= 1
+    for row in range(board.rows):
+        board.data[row * C : (row + 1) * C] = roll(board.row(row), rolled_segments)
 
     return board
 
 
-def spin_cycle(board: List[List[str]]) -> List[List[str]]:
-    return tilt_east(tilt_south(tilt_west(tilt_north(board))))
+def spin_cycle(
+    board: Grid,
+    rolled_to_start: Optional[RolledSegments] = None,
+    rolled_to_end: Optional[RolledSegments] = None,
+) -> Grid:
+    """One cycle of tilts. Pass the same caches to every cycle of a board, so its
+    segments are only rolled the first time they show up.
+    """
+    if rolled_to_start is None:
+        rolled_to_start = RolledSegments(True)
+    if rolled_to_end is None:
+        rolled_to_end = RolledSegments(False)
 
+    tilt_north(board, rolled_to_start)
+    tilt_west(board, rolled_to_start)
+    tilt_south(board, rolled_to_end)
+    return tilt_east(board, rolled_to_end)
 
-def many_spin_cycles(board: List[List[str]], num_cycles: int) -> List[List[str]]:
-    history: Dict[str, int] = {}
 
-    def to_string(board: List[List[str]]) -> str:
-        return "".join("".join(row) for row in board)
+def many_spin_cycles(board: Grid, num_cycles: int) -> Grid:
+    history: Dict[bytes, int] = {}
+    # rolled segments of this board, dropped with it when the cycles are done
+    rolled_to_start: RolledSegments = RolledSegments(True)
+    rolled_to_end: RolledSegments = RolledSegments(False)
 
-    def from_string(board_str: str, R: int, C: int) -> List[List[str]]:
-        return [[board_str[row * C + col] for col in range(C)] for row in range(R)]
+    def to_string(board: Grid) -> bytes:
+        return bytes(board.data)
+
+    def from_string(board_str: bytes, R: int, C: int) -> Grid:
+        return Grid(R, C, bytearray(board_str))
 
     for iteration in range(1, num_cycles + 1):
         if iteration % 10000 == 0:
             logger.debug(f"{iteration=}")
 
-        board = spin_cycle(board)
+        board = spin_cycle(board, rolled_to_start, rolled_to_end)
 
         board_str = to_string(board)
         if board_str in history:
@@ -141,8 +150,8 @@ def many_spin_cycles(board: List[List[str]], num_cycles: int) -> List[List[str]]
 
             return from_string(
                 list(history.keys())[last_cycle_index_in_history],
-                len(board),
-                len(board[0]),
+                board.rows,
+                board.cols,
             )
 
         else:
@@ -151,25 +160,18 @@ def many_spin_cycles(board: List[List[str]], num_cycles: int) -> List[List[str]]
     return board
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day14.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
-
-    board: List[List[str]] = [[s for s in line] for line in input_lines]
+    board: Grid = Grid.from_file(input_file)
 
     board = many_spin_cycles(board, NUM_CYCLES)
 
     answer: int = calc_north_load(board)
     logger.info(f"{answer=}")  # 104409
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,7 +1,7 @@
-import time
 from typing import List
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -17,21 +17,16 @@ def calc_HASH(input_str: str) -> int:
     return answer
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day15.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     answer: int = sum(calc_HASH(input_str) for input_str in input_lines[0].split(","))
     logger.info(f"{answer=}")  # 517965
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
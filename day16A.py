@@ -1,8 +1,8 @@
-import time
 import queue
 from typing import Dict, List, Tuple
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
 
 DEBUG: bool = False
 
@@ -25,11 +25,12 @@ UPPER_LEFT_REFLECT: Dict[int, int] = {
     UP: LEFT,
 }
 
-EMPTY: str = "."
-MIRROR_UPPER_RIGHT = "/"
-MIRROR_UPPER_LEFT = "\\"
-VERTICAL_SPLITTER = "|"
-HORIZONTAL_SPLITTER = "-"
+# cells are compared as the bytes they are stored as in the Grid
+EMPTY: int = ord(".")
+MIRROR_UPPER_RIGHT: int = ord("/")
+MIRROR_UPPER_LEFT: int = ord("\\")
+VERTICAL_SPLITTER: int = ord("|")
+HORIZONTAL_SPLITTER: int = ord("-")
 
 
 def valid(row: int, col: int, R: int, C: int) -> bool:
@@ -37,7 +38,7 @@ def valid(row: int, col: int, R: int, C: int) -> bool:
 
 
 def get_neighbors(
-    row: int, col: int, current_char: str, current_direction: int, R: int, C: int
+    row: int, col: int, current_char: int, current_direction: int, R: int, C: int
 ) -> List[Tuple[int, int, int]]:
     potential_neighbors: List[Tuple[int, int, int]] = []
 
@@ -83,9 +84,9 @@ def get_neighbors(
     ]
 
 
-def flood_fill(board: List[List[str]]) -> int:
-    R: int = len(board)
-    C: int = len(board[0])
+def flood_fill(board: Grid) -> int:
+    R: int = board.rows
+    C: int = board.cols
 
     start_row: int = 0
     start_col: int = 0
@@ -93,49 +94,39 @@ def flood_fill(board: List[List[str]]) -> int:
     q: queue.Queue = queue.Queue()
     q.put((start_row, start_col, 0))
 
-    visited: List[List[List[bool]]] = [
-        [[False] * 4 for i in range(C)] for j in range(R)
-    ]
+    # bit `direction` of visited[row * C + col] is set once a beam passed that way
+    visited: bytearray = bytearray(R * C)
 
     while not q.empty():
         row, col, direction = q.get()
 
-        if visited[row][col][direction]:
+        if visited[row * C + col] >> direction & 1:
             continue
-        visited[row][col][direction] = True
+        visited[row * C + col] |= 1 << direction
 
         #  logger.debug(f'Checking out {row=},{col=} in direction {direction}')
 
-        for neighbor in get_neighbors(row, col, board[row][col], direction, R, C):
-            if not visited[neighbor[0]][neighbor[1]][neighbor[2]]:
+        for neighbor in get_neighbors(
+            row, col, board.data[row * C + col], direction, R, C
+        ):
+            if not visited[neighbor[0] * C + neighbor[1]] >> neighbor[2] & 1:
                 q.put(neighbor)
 
-    count_visited: int = 0
-    for row in visited:
-        for col in row:
-            if any(col):
-                count_visited += 1
+    count_visited: int = len(visited) - visited.count(0)
 
     return count_visited
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day16.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
-
-    board: List[List[str]] = [[s for s in line] for line in input_lines]
+    board: Grid = Grid.from_file(input_file)
 
     answer: int = flood_fill(board)
     logger.info(f"{answer=}")  # 7517
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,9 +1,10 @@
 import functools
-import time
 from queue import PriorityQueue
 from typing import Dict, List, Tuple
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
+from profiler import profiled
 
 DEBUG: bool = False
 
@@ -12,6 +13,8 @@ UP: int = 1
 LEFT: int = 2
 DOWN: int = 3
 
+ZERO: int = ord("0")
+
 
 @functools.total_ordering
 class Node:
@@ -70,11 +73,10 @@ def get_neighbors(curr_node: Node) -> List[Node]:
     ]
 
 
-def dijkstra(
-    heat_loss: List[List[int]], source: Tuple[int, int], dest: Tuple[int, int]
-) -> int:
-    R: int = len(heat_loss)
-    C: int = len(heat_loss[0])
+@profiled
+def dijkstra(heat_loss: Grid, source: Tuple[int, int], dest: Tuple[int, int]) -> int:
+    R: int = heat_loss.rows
+    C: int = heat_loss.cols
 
     BIG: int = 9 * R * C + 1
 
@@ -108,7 +110,11 @@ def dijkstra(
 
         for neighbor in get_neighbors(curr_node):
             if valid(neighbor.row, neighbor.col, R, C) and neighbor not in visited:
-                new_dist: int = dist[curr_node] + heat_loss[neighbor.row][neighbor.col]
+                new_dist: int = (
+                    dist[curr_node]
+                    + heat_loss.data[neighbor.row * C + neighbor.col]
+                    - ZERO
+                )
 
                 #  logger.debug(f'Consider neighbor {neighbor} with {new_dist=}')
 
@@ -127,20 +133,14 @@ def dijkstra(
                         )
                     )
 
-    trail = [[False] * C for row in range(R)]
+    trail: Grid = Grid(R, C)
     curr = last_node
     while curr in parents:
-        trail[curr.row][curr.col] = True
+        trail[curr.row, curr.col] = "X"
         curr = parents[curr]
 
     logger.debug("trail")
-    for row in trail:
-        for col in row:
-            if col:
-                print("X", end="")
-            else:
-                print(".", end="")
-        print()
+    print(trail)
 
     answer: int = BIG
     for direction in range(4):
@@ -151,25 +151,17 @@ def dijkstra(
     return answer
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day17.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
-
-    heat_loss: List[List[int]] = [[int(s) for s in line] for line in input_lines]
+    # heat losses are single digits, kept as the digit characters of the input
+    heat_loss: Grid = Grid.from_file(input_file)
 
-    answer: int = dijkstra(
-        heat_loss, (0, 0), (len(heat_loss) - 1, len(heat_loss[0]) - 1)
-    )
+    answer: int = dijkstra(heat_loss, (0, 0), (heat_loss.rows - 1, heat_loss.cols - 1))
     logger.info(f"{answer=}")  # 1256
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,7 +1,7 @@
-import time
 from typing import Dict, List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -64,12 +64,10 @@ def calc_area(instructions: List[Tuple[int, int, str]]) -> int:
     return exterior_length + num_interior_points
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day18.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     instructions: List[Tuple[int, int, str]] = []
     for line in input_lines:
@@ -85,11 +83,8 @@ def main() -> None:
     answer: int = calc_area(instructions)
     logger.info(f"{answer=}")  # 50465
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,9 +1,9 @@
 import math
 import queue
-import time
 from typing import Dict, List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -115,12 +115,18 @@ def run_ranges(name_to_workflow: Dict[str, Workflow]) -> int:
     while not q.empty():
         name, xmas_ranges = q.get()
 
-        logger.debug(f"Working with {name} + {[str(s) for s in xmas_ranges]}")
+        if __debug__:
+            logger.debug(
+                "Working with {} + {}",
+                lambda: name,
+                lambda: [str(s) for s in xmas_ranges],
+                lazy=True,
+            )
 
         if name == ACCEPT:
             old: int = answer
             answer += math.prod(len(letter_range) for letter_range in xmas_ranges)
-            logger.info(f"Added {answer - old}")
+            logger.info("Added {}", answer - old)
             continue
 
         current_workflow: Workflow = name_to_workflow[name]
@@ -128,9 +134,12 @@ def run_ranges(name_to_workflow: Dict[str, Workflow]) -> int:
             xmas_ranges
         )
 
-        logger.debug(
-            f"Resulted in => {[(k, [str(s) for s in v]) for k, v in resulting_work]}"
-        )
+        if __debug__:
+            logger.debug(
+                "Resulted in => {}",
+                lambda: [(k, [str(s) for s in v]) for k, v in resulting_work],
+                lazy=True,
+            )
 
         for work in resulting_work:
             if work[0] != REJECT:
@@ -139,12 +148,10 @@ def run_ranges(name_to_workflow: Dict[str, Workflow]) -> int:
     return answer
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day19.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     name_to_workflow: Dict[str, Workflow] = {}
 
@@ -161,11 +168,8 @@ def main() -> None:
 
     # that is, 117_954_800_808_317
 
+    return answer
+
 
 if __name__ == "__main__":
-    start_time = time.time()
-    main()
-
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+    time_solver(main)
@@ -1,8 +1,8 @@
-import time
 from queue import Queue
 from typing import cast, Dict, List, Set
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -120,12 +120,10 @@ class MachineNetwork:
             self.name_to_queue = next_step_queues
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day20.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     network: MachineNetwork = MachineNetwork()
     conjuction_names: Set[str] = set()
@@ -176,11 +174,8 @@ def main() -> None:
     answer: int = network.num_low_pulses * network.num_high_pulses
     logger.info(f"{answer=}")  # 834323022
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
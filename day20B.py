@@ -46,11 +46,11 @@ Want high pulses from bt, dl, fr, rv
     That is, 225,386,464,601,017
 """
 
-import time
 from queue import Queue
 from typing import cast, Dict, List, Set
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -208,12 +208,10 @@ class MachineNetwork:
             logger.info(f'Module {name} has iterations {sorted(self.history_states[name].values())}')
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day20.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     network: MachineNetwork = MachineNetwork()
     conjuction_names: Set[str] = set()
@@ -268,11 +266,8 @@ def main() -> None:
 
     breakpoint()
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,7 +1,7 @@
-import time
 from typing import List, Set, Tuple
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
 
 DEBUG: bool = False
 
@@ -9,17 +9,19 @@ START_SYMBOL: str = "S"
 GARDEN_PLOT: str = "."
 ROCK: str = "#"
 
+GARDEN_PLOT_CELL: int = ord(GARDEN_PLOT)
 
-def valid(board: List[List[str]], row: int, col: int) -> bool:
+
+def valid(board: Grid, row: int, col: int) -> bool:
     return (
-        0 <= row < len(board)
-        and 0 <= col < len(board[row])
-        and board[row][col] == GARDEN_PLOT
+        0 <= row < board.rows
+        and 0 <= col < board.cols
+        and board.data[row * board.cols + col] == GARDEN_PLOT_CELL
     )
 
 
 def get_positions_n_away(
-    board: List[List[str]], start_pos: Tuple[int, int], n: int
+    board: Grid, start_pos: Tuple[int, int], n: int
 ) -> Set[Tuple[int, int]]:
     zero_away: Set[Tuple[int, int]] = {start_pos}
     k_away = zero_away
@@ -45,37 +47,19 @@ def get_positions_n_away(
     return k_away
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day21.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
-
-    board: List[List[str]] = [[s for s in line] for line in input_lines]
-
-    start_row: int = -1
-    start_col: int = -1
+    board: Grid = Grid.from_file(input_file)
 
-    for row_index, row in enumerate(board):
-        for col_index, col in enumerate(row):
-            if col == START_SYMBOL:
-                start_row = row_index
-                start_col = col_index
-                board[start_row][start_col] = GARDEN_PLOT
-                break
-
-        if start_row != -1:
-            break
+    start_row, start_col = board.find(START_SYMBOL)
+    board[start_row, start_col] = GARDEN_PLOT
 
     answer: int = len(get_positions_n_away(board, (start_row, start_col), 64))
     logger.info(f"{answer=}")  # 3858
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -15,10 +15,10 @@ f(x) = a*x*x +bx + c, and extrapolate to find step 2005.
 This script took 435s 789.311ms
 """
 
-import time
 from typing import List, Set, Tuple
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
 
 DEBUG: bool = False
 
@@ -26,14 +26,19 @@ START_SYMBOL: str = "S"
 GARDEN_PLOT: str = "."
 ROCK: str = "#"
 
+GARDEN_PLOT_CELL: int = ord(GARDEN_PLOT)
+
 NAIVE_MULTIPLIER: int = 13
 
 
-def expand_board(board: List[List[str]], k: int) -> List[List[str]]:
-    R: int = len(board)
-    C: int = len(board[0])
+def expand_board(board: Grid, k: int) -> Grid:
+    R: int = board.rows
+    C: int = board.cols
 
-    return [[board[i % R][j % C] for i in range(C * k)] for j in range(R * k)]
+    # k copies of each row side by side, and k copies of those rows stacked
+    return Grid(
+        R * k, C * k, bytearray(b"".join(board.row(i % R) * k for i in range(R * k)))
+    )
 
 
 def get_expanded_start_pos(
@@ -42,16 +47,16 @@ def get_expanded_start_pos(
     return (start_pos[0] + R * (k // 2), start_pos[1] + C * (k // 2))
 
 
-def valid(board: List[List[str]], row: int, col: int) -> bool:
+def valid(board: Grid, row: int, col: int) -> bool:
     return (
-        0 <= row < len(board)
-        and 0 <= col < len(board[row])
-        and board[row][col] == GARDEN_PLOT
+        0 <= row < board.rows
+        and 0 <= col < board.cols
+        and board.data[row * board.cols + col] == GARDEN_PLOT_CELL
     )
 
 
 def get_num_positions_n_away(
-    board: List[List[str]], start_pos: Tuple[int, int], n: int
+    board: Grid, start_pos: Tuple[int, int], n: int
 ) -> List[int]:
     logger.info(f"Naive search for multiplier = {NAIVE_MULTIPLIER} and num_steps = {n}")
     zero_away: Set[Tuple[int, int]] = {start_pos}
@@ -132,35 +137,20 @@ def extrapolate(history_count: List[int], N: int, desired_step: int) -> int:
     return segmented_history_count[found_index + 2] + to_add
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day21.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
-
-    board: List[List[str]] = [[s for s in line] for line in input_lines]
-    N: int = len(board)
-
-    start_row: int = -1
-    start_col: int = -1
+    board: Grid = Grid.from_file(input_file)
+    N: int = board.rows
 
-    for row_index, row in enumerate(board):
-        for col_index, col in enumerate(row):
-            if col == START_SYMBOL:
-                start_row = row_index
-                start_col = col_index
-                board[start_row][start_col] = GARDEN_PLOT
-                break
-
-        if start_row != -1:
-            break
+    start_row, start_col = board.find(START_SYMBOL)
+    board[start_row, start_col] = GARDEN_PLOT
 
     # manually set NAIVE_MULTIPLIER. Search naively until the borders: (NAIVE_MULTIPLIER // 2) * N (half the expanded border)
     history_count: List[int] = get_num_positions_n_away(
         expand_board(board, NAIVE_MULTIPLIER),
         get_expanded_start_pos(
-            (start_row, start_col), len(board), len(board[0]), NAIVE_MULTIPLIER
+            (start_row, start_col), board.rows, board.cols, NAIVE_MULTIPLIER
         ),
         (NAIVE_MULTIPLIER // 2) * N,
     )
@@ -169,14 +159,11 @@ def main() -> None:
     answer: int = extrapolate(history_count, N, 26501365)
     logger.info(f"{answer=}")  # 636350496972143
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
 
 
 """
@@ -1,7 +1,7 @@
-import time
 from typing import Dict, Generator, List, Set, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -128,12 +128,10 @@ def check_safe_to_disintegrate(nodes: List[Node], brick_index: int) -> bool:
     )
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day22.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     bricks: List[Brick] = []
     for line in input_lines:
@@ -171,11 +169,8 @@ def main() -> None:
     answer: int = num_nodes_can_be_safely_disintegrated
     logger.info(f"{answer=}")  # 448
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,8 +1,9 @@
-import time
 from queue import Queue
 from typing import Dict, Generator, List, Set, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from profiler import profiled
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -58,6 +59,7 @@ class Node:
         self.outputs: Set[int] = set()
 
 
+@profiled
 def bricks_fall_down(bricks: List[Brick]) -> Dict[Tuple[int, int, int], int]:
     space_occupied: Dict[Tuple[int, int, int], int] = {}
 
@@ -167,12 +169,10 @@ def get_affected_nodes_when_disintegrated(
     return answer
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day22.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     bricks: List[Brick] = []
     for line in input_lines:
@@ -203,11 +203,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 57770
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
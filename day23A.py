@@ -1,8 +1,8 @@
-import time
 from queue import Queue
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
 
 DEBUG: bool = False
 
@@ -19,54 +19,52 @@ def is_valid(row: int, col: int, R: int, C: int) -> bool:
 
 
 def get_neighbor_list(
-    board: List[List[str]], node_position: Tuple[int, int]
+    board: Grid, node_position: Tuple[int, int]
 ) -> List[Tuple[int, int]]:
     row: int = node_position[0]
     col: int = node_position[1]
     dxs: List[int] = [-1, 0, 1, 0]
     dys: List[int] = [0, 1, 0, -1]
 
-    if board[row][col] in ARROWS:
-        changes: Tuple[int, int] = ARROWS[board[row][col]]
+    changes: Optional[Tuple[int, int]] = ARROWS.get(board[row, col])
+    if changes is not None:
         return [(row + changes[0], col + changes[1])]
 
     return [(row + dxs[k], col + dys[k]) for k in range(len(dxs))]
 
 
-def can_reach_arrow(
-    board: List[List[str]], pos: Tuple[int, int], arrow: Tuple[int, int]
-) -> bool:
-    if board[arrow[0]][arrow[1]] == ">":
+def can_reach_arrow(board: Grid, pos: Tuple[int, int], arrow: Tuple[int, int]) -> bool:
+    if board[arrow] == ">":
         return arrow[0] == pos[0] and arrow[1] == pos[1] + 1
-    if board[arrow[0]][arrow[1]] == "^":
+    if board[arrow] == "^":
         return arrow[0] == pos[0] - 1 and arrow[1] == pos[1]
-    if board[arrow[0]][arrow[1]] == "<":
+    if board[arrow] == "<":
         return arrow[0] == pos[0] and arrow[1] == pos[1] - 1
-    if board[arrow[0]][arrow[1]] == "v":
+    if board[arrow] == "v":
         return arrow[0] == pos[0] + 1 and arrow[1] == pos[1]
 
     return False
 
 
-def create_index_of_arrows(board: List[List[str]]) -> Dict[Tuple[int, int], int]:
+def create_index_of_arrows(board: Grid) -> Dict[Tuple[int, int], int]:
     answer: Dict[Tuple[int, int], int] = {}
 
-    for i in range(len(board)):
-        for j in range(len(board[i])):
-            if board[i][j] in ARROWS:
+    for i in range(board.rows):
+        for j in range(board.cols):
+            if board[i, j] in ARROWS:
                 answer[(i, j)] = len(answer)
 
     return answer
 
 
-def generate_graph(board: List[List[str]]) -> Dict[int, List[Tuple[int, int]]]:
+def generate_graph(board: Grid) -> Dict[int, List[Tuple[int, int]]]:
     """Create edge list: a map from arrow-index to List(arrow-index neighbor, distance to neighbor)"""
-    R: int = len(board)
-    C: int = len(board[0])
+    R: int = board.rows
+    C: int = board.cols
 
     # first mark start and end points
-    board[0][1] = "v"
-    board[R - 1][C - 2] = "v"
+    board[0, 1] = "v"
+    board[R - 1, C - 2] = "v"
 
     arrow_position_to_index: Dict[Tuple[int, int], int] = create_index_of_arrows(board)
     arrow_index_to_position: List[Tuple[int, int]] = [
@@ -104,8 +102,9 @@ def generate_graph(board: List[List[str]]) -> Dict[int, List[Tuple[int, int]]]:
                 ):
                     row2: int = neighbor_position[0]
                     col2: int = neighbor_position[1]
+                    cell: str = board[row2, col2]
 
-                    if board[row2][col2] in ARROWS and can_reach_arrow(
+                    if cell in ARROWS and can_reach_arrow(
                         board, node_position, neighbor_position
                     ):
                         distance[row2][col2] = min(
@@ -121,7 +120,7 @@ def generate_graph(board: List[List[str]]) -> Dict[int, List[Tuple[int, int]]]:
                         )
                         #  edges[neighbor_arrow_index].append(start_node)
 
-                    elif board[row2][col2] == ".":
+                    elif cell == ".":
                         distance[row2][col2] = min(
                             1 + distance[node_position[0]][node_position[1]],
                             distance[row2][col2],
@@ -171,24 +170,17 @@ def longest_path_length_in_dag(edges: Dict[int, List[Tuple[int, int]]]) -> int:
     return distances[-1]
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day23.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
-
-    board: List[List[str]] = [list(line) for line in input_lines]
+    board: Grid = Grid.from_file(input_file)
     edges: Dict[int, List[Tuple[int, int]]] = generate_graph(board)
 
     answer: int = longest_path_length_in_dag(edges)
     logger.info(f"{answer=}")  # 1998
 
+    return answer
+
 
 if __name__ == "__main__":
-    start_time = time.time()
-    main()
-
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+    time_solver(main)
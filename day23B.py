@@ -1,8 +1,9 @@
-import time
 from queue import Queue
 from typing import Dict, List, Tuple
 
-from loguru import logger
+from grid import Grid
+from log import logger, time_solver
+from profiler import profiled
 
 DEBUG: bool = False
 
@@ -20,21 +21,21 @@ def get_neighbor_list(node_position: Tuple[int, int]) -> List[Tuple[int, int]]:
     return [(row + dxs[k], col + dys[k]) for k in range(len(dxs))]
 
 
-def create_index_of_intersections(board: List[List[str]]) -> Dict[Tuple[int, int], int]:
+def create_index_of_intersections(board: Grid) -> Dict[Tuple[int, int], int]:
     answer: Dict[Tuple[int, int], int] = {}
 
-    for i in range(len(board)):
-        for j in range(len(board[i])):
-            if board[i][j] == "I":
+    for i in range(board.rows):
+        for j in range(board.cols):
+            if board[i, j] == "I":
                 answer[(i, j)] = len(answer)
 
     return answer
 
 
-def generate_graph(board: List[List[str]]) -> Dict[int, List[Tuple[int, int]]]:
+def generate_graph(board: Grid) -> Dict[int, List[Tuple[int, int]]]:
     """Create edge list: a map from intersection-index to List(intersection-index neighbor, distance to neighbor)"""
-    R: int = len(board)
-    C: int = len(board[0])
+    R: int = board.rows
+    C: int = board.cols
 
     intersection_position_to_index: Dict[
         Tuple[int, int], int
@@ -76,8 +77,9 @@ def generate_graph(board: List[List[str]]) -> Dict[int, List[Tuple[int, int]]]:
                 ):
                     row2: int = neighbor_position[0]
                     col2: int = neighbor_position[1]
+                    cell: str = board[row2, col2]
 
-                    if board[row2][col2] == "I":
+                    if cell == "I":
                         distance[row2][col2] = min(
                             1 + distance[node_position[0]][node_position[1]],
                             distance[row2][col2],
@@ -88,7 +90,7 @@ def generate_graph(board: List[List[str]]) -> Dict[int, List[Tuple[int, int]]]:
                         edges[start_node].append(
                             (neighbor_intersection_index, distance[row2][col2])
                         )
-                    elif board[row2][col2] == ".":
+                    elif cell == ".":
                         distance[row2][col2] = min(
                             1 + distance[node_position[0]][node_position[1]],
                             distance[row2][col2],
@@ -98,6 +100,7 @@ def generate_graph(board: List[List[str]]) -> Dict[int, List[Tuple[int, int]]]:
     return edges
 
 
+@profiled
 def dfs(edges: Dict[int, List[Tuple[int, int]]]) -> int:
     N: int = len(edges)
     visited: List[bool] = [False] * N
@@ -129,41 +132,37 @@ def dfs(edges: Dict[int, List[Tuple[int, int]]]) -> int:
     return dfs_helper(0, 0, [])
 
 
-def transform_board(board: List[List[str]]) -> None:
+def transform_board(board: Grid) -> None:
     # clear out arrows
-    R: int = len(board)
-    C: int = len(board[0])
+    R: int = board.rows
+    C: int = board.cols
 
     for i in range(R):
         for j in range(C):
-            if board[i][j] in {">", "^", "<", "v"}:
-                board[i][j] = "."
+            if board[i, j] in {">", "^", "<", "v"}:
+                board[i, j] = "."
 
     # find intersection nodes: those that have at least 3 dots surroudning it
     for i in range(C):
         for j in range(C):
-            if board[i][j] == ".":
+            if board[i, j] == ".":
                 num_path_neighbors: int = 0
                 for row2, col2 in get_neighbor_list((i, j)):
-                    if is_valid(row2, col2, R, C) and board[row2][col2] == ".":
+                    if is_valid(row2, col2, R, C) and board[row2, col2] == ".":
                         num_path_neighbors += 1
 
                 if num_path_neighbors >= 3:
-                    board[i][j] = "I"
+                    board[i, j] = "I"
 
     # mark begin and end nodes as intersection nodes
-    board[0][1] = "I"
-    board[R - 1][C - 2] = "I"
+    board[0, 1] = "I"
+    board[R - 1, C - 2] = "I"
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day23.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
-
-    board: List[List[str]] = [list(line) for line in input_lines]
+    board: Grid = Grid.from_file(input_file)
     transform_board(board)
 
     edges: Dict[int, List[Tuple[int, int]]] = generate_graph(board)
@@ -190,11 +189,8 @@ def main() -> None:
     # There are 36 nodes
     # Took 277s 28.896ms
 
+    return answer
+
 
 if __name__ == "__main__":
-    start_time = time.time()
-    main()
-
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+    time_solver(main)
@@ -1,8 +1,8 @@
-import time
 from fractions import Fraction
 from typing import List, Optional, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -69,12 +69,10 @@ def generate_intersection(
     return None
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day24.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     hail: List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = []
     for line in input_lines:
@@ -111,11 +109,8 @@ def main() -> None:
 
     logger.info(f"{answer=}")  # 15107
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -28,11 +28,10 @@ Then, treat as linear system of equations with 6 unknowns:
 Pxr, Pyr, Pzr, Vxr, Vyr, Vzr.
 """
 
-import time
-from pprint import pprint
 from typing import List, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -86,6 +85,8 @@ def get_coefficient_matrix_and_b(
 def gaussian_elimination(
     coefficient_matrix_int: List[List[int]], b_vector_int: List[int]
 ) -> List[float]:
+    from pprint import pprint
+
     pprint(coefficient_matrix_int)
     pprint(b_vector_int)
 
@@ -139,12 +140,10 @@ def calc_rock_position_and_velocity(
     return (rock_position, rock_velocity)
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day24.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     hail: List[Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = []
     for line in input_lines:
@@ -179,11 +178,8 @@ def main() -> None:
     # rock position = (422644646660238.0, 244357651988392.0, 189640099899118.12)
     # and velocity = (-260.0000000000001, 34.00000000000006, 181.00000000000006)
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -1,9 +1,8 @@
-import time
-from pprint import pprint
 from queue import Queue
 from typing import Dict, List, Set, Tuple
 
-from loguru import logger
+from log import logger, time_solver
+from puzzle_input import read_lines
 
 DEBUG: bool = False
 
@@ -106,6 +105,8 @@ def min_cut_partitions(
 
 
 def build_edges(input_lines: List[str]) -> List[List[int]]:
+    from pprint import pprint
+
     initial_dict: Dict[str, List[str]] = {}
 
     for line in input_lines:
@@ -163,12 +164,10 @@ def find_farthest_parts_of_graph(edges: List[List[int]]) -> Tuple[int, int]:
     return node_1, node_2
 
 
-def main() -> None:
+def main() -> int:
     input_file: str = "inputs/dummy.txt" if DEBUG else "inputs/day25.txt"
 
-    input_lines: List[str] = []
-    with open(input_file, "r") as fd:
-        input_lines = [line.strip() for line in fd.readlines()]
+    input_lines: List[str] = read_lines(input_file)
 
     edges: List[List[int]] = build_edges(input_lines)
     source, sink = find_farthest_parts_of_graph(edges)
@@ -179,11 +178,8 @@ def main() -> None:
     answer: int = len(visitable_from_source) * len(visitable_from_sink)
     logger.info(f"{answer=}")  # 507626
 
+    return answer
 
-if __name__ == "__main__":
-    start_time = time.time()
-    main()
 
-    time_took: float = time.time() - start_time
-    seconds_took: int = int(time_took)
-    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
+if __name__ == "__main__":
+    time_solver(main)
@@ -0,0 +1,514 @@
+"""Generate puzzle inputs many times larger than the real ones.
+
+Run with "$ python3 generators.py 10 16 --scale 10 100 1000" to write
+inputs/generated/day10_x10.txt, inputs/generated/day10_x100.txt, ... for days 10
+and 16. Without day numbers, inputs are generated for every day that has a
+generator.
+
+The scale is how many times larger the generated input is than the real one: for
+grids it multiplies the number of cells, for everything else the number of lines
+or items. Every generated input is valid for the day's puzzle, and the same
+--seed always produces the same input.
+"""
+
+import argparse
+import math
+import os
+import random
+import string
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import runner
+
+GENERATED_DIRECTORY: str = os.path.join(runner.REPO_DIRECTORY, "inputs", "generated")
+
+DEFAULT_SCALES: List[int] = [10, 100, 1000]
+
+ENGLISH_DIGITS: List[str] = [
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+
+
+def generated_input_path(day: int, scale: int) -> str:
+    return os.path.join(GENERATED_DIRECTORY, f"day{day:02d}_x{scale}.txt")
+
+
+def scaled_side(base_side: int, scale: int) -> int:
+    """Side length of a square grid with `scale` times as many cells."""
+    return int(round(base_side * math.sqrt(scale)))
+
+
+def generate_day01(scale: int, rng: random.Random) -> Iterator[str]:
+    """Calibration lines: letters mixed with digits and spelled-out digits.
+
+    Every line has at least one numeric digit, so it is valid for both parts.
+    """
+    for _ in range(1000 * scale):
+        pieces: List[str] = []
+        for _ in range(rng.randint(2, 8)):
+            choice: float = rng.random()
+            if choice < 0.3:
+                pieces.append(str(rng.randint(1, 9)))
+            elif choice < 0.6:
+                pieces.append(rng.choice(ENGLISH_DIGITS))
+            else:
+                pieces.append(
+                    "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+                )
+
+        if not any(piece.isdigit() for piece in pieces):
+            pieces.insert(rng.randint(0, len(pieces)), str(rng.randint(1, 9)))
+
+        yield "".join(pieces)
+
+
+def generate_day02(scale: int, rng: random.Random) -> Iterator[str]:
+    for game_id in range(1, 100 * scale + 1):
+        subsets: List[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colors: List[str] = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            subsets.append(
+                ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+            )
+
+        yield f"Game {game_id}: " + "; ".join(subsets)
+
+
+def generate_day03(scale: int, rng: random.Random) -> Iterator[str]:
+    """Engine schematic: numbers and symbols scattered over dots."""
+    side: int = scaled_side(140, scale)
+    symbols: str = "*#+$/@%&=-"
+
+    for _ in range(side):
+        row: List[str] = []
+        while len(row) < side:
+            choice: float = rng.random()
+            num_digits: int = rng.randint(1, 3)
+            if choice < 0.12 and len(row) + num_digits < side:
+                row.extend(str(rng.randint(10 ** (num_digits - 1), 10**num_digits - 1)))
+                # numbers on the same row must be separated
+                row.append(".")
+            elif choice < 0.2:
+                row.append(rng.choice(symbols))
+            else:
+                row.append(".")
+
+        yield "".join(row[:side])
+
+
+def generate_day04(scale: int, rng: random.Random) -> Iterator[str]:
+    """Scratchcards with 10 winning numbers and 25 picks each.
+
+    A card never wins copies of cards past the end of the table.
+    """
+    num_cards: int = 218 * scale
+    width: int = len(str(num_cards))
+
+    for card_index in range(num_cards):
+        winners: List[int] = rng.sample(range(1, 100), 10)
+        num_matches: int = min(rng.randint(0, 10), num_cards - card_index - 1)
+
+        winner_set = set(winners)
+        losers: List[int] = rng.sample(
+            [num for num in range(1, 100) if num not in winner_set], 25 - num_matches
+        )
+        picks: List[int] = rng.sample(winners, num_matches) + losers
+        rng.shuffle(picks)
+
+        yield (
+            f"Card {card_index + 1:>{width}}: "
+            + " ".join(f"{num:2d}" for num in winners)
+            + " | "
+            + " ".join(f"{num:2d}" for num in picks)
+        )
+
+
+def generate_day05(scale: int, rng: random.Random) -> Iterator[str]:
+    """Almanac: seed ranges and seven maps, each a bijection on the ranges it covers."""
+    max_value: int = 2**32
+    num_seed_ranges: int = 10 * scale
+    num_ranges_per_map: int = 25 * scale
+
+    seeds: List[str] = []
+    for _ in range(num_seed_ranges):
+        start: int = rng.randrange(max_value)
+        seeds.append(f"{start} {rng.randint(1, (max_value - start) // 10 + 1)}")
+    yield "seeds: " + " ".join(seeds)
+
+    names: List[str] = [
+        "seed",
+        "soil",
+        "fertilizer",
+        "water",
+        "light",
+        "temperature",
+        "humidity",
+        "location",
+    ]
+    for source_name, dest_name in zip(names, names[1:]):
+        yield ""
+        yield f"{source_name}-to-{dest_name} map:"
+
+        cuts: List[int] = sorted(rng.sample(range(1, max_value), num_ranges_per_map))
+        segments: List[Tuple[int, int]] = [
+            (start, end - start) for start, end in zip([0] + cuts, cuts + [max_value])
+        ]
+
+        # lay the segments out again in shuffled order to get their destinations
+        shuffled: List[Tuple[int, int]] = segments[:]
+        rng.shuffle(shuffled)
+        dest_start: Dict[int, int] = {}
+        position: int = 0
+        for start, length in shuffled:
+            dest_start[start] = position
+            position += length
+
+        for start, length in segments:
+            # leave some ranges unmapped, so they map through as the identity
+            if rng.random() < 0.8:
+                yield f"{dest_start[start]} {start} {length}"
+
+
+def generate_day06(scale: int, rng: random.Random) -> Iterator[str]:
+    times: List[int] = [rng.randint(10, 100) for _ in range(4 * scale)]
+    # the record must be beatable
+    records: List[int] = [rng.randint(1, time * time // 4 - 1) for time in times]
+
+    yield "Time:    " + " ".join(f"{time:>6}" for time in times)
+    yield "Distance:" + " ".join(f"{record:>6}" for record in records)
+
+
+def generate_day07(scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(1000 * scale):
+        yield "".join(rng.choices("23456789TJQKA", k=5)) + f" {rng.randint(1, 1000)}"
+
+
+def generate_day10(scale: int, rng: random.Random) -> Iterator[str]:
+    """Pipe maze with a single loop through S, junk pipes everywhere else.
+
+    The loop is the outline of a random spanning tree over 3x3 blocks of tiles:
+    every block starts as a small loop around its middle tile, and each tree edge
+    joins the loops of the two blocks it connects, enclosing the tiles between
+    them. Tiles inside the loop and blocks left out of the tree are filled with
+    junk pipes.
+    """
+    BLOCK_SIZE: int = 3
+    side: int = scaled_side(140, scale) // BLOCK_SIZE
+    num_blocks: int = side * side
+
+    UP_BIT: int = 1
+    DOWN_BIT: int = 2
+    LEFT_BIT: int = 4
+    RIGHT_BIT: int = 8
+
+    tree_edges: bytearray = bytearray(num_blocks)
+    in_tree: bytearray = bytearray(num_blocks)
+
+    # randomized Prim's algorithm from the middle, stopping at 70% of the blocks
+    root: int = (side // 2) * side + side // 2
+    in_tree[root] = 1
+    frontier: List[Tuple[int, int]] = []
+
+    def add_frontier(block: int) -> None:
+        row, col = divmod(block, side)
+        if row > 0:
+            frontier.append((block, block - side))
+        if row < side - 1:
+            frontier.append((block, block + side))
+        if col > 0:
+            frontier.append((block, block - 1))
+        if col < side - 1:
+            frontier.append((block, block + 1))
+
+    add_frontier(root)
+    num_in_tree: int = 1
+    while frontier and num_in_tree < 0.7 * num_blocks:
+        index: int = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        block, neighbor = frontier.pop()
+        if in_tree[neighbor]:
+            continue
+
+        if neighbor == block - side:
+            tree_edges[block] |= UP_BIT
+            tree_edges[neighbor] |= DOWN_BIT
+        elif neighbor == block + side:
+            tree_edges[block] |= DOWN_BIT
+            tree_edges[neighbor] |= UP_BIT
+        elif neighbor == block - 1:
+            tree_edges[block] |= LEFT_BIT
+            tree_edges[neighbor] |= RIGHT_BIT
+        else:
+            tree_edges[block] |= RIGHT_BIT
+            tree_edges[neighbor] |= LEFT_BIT
+
+        in_tree[neighbor] = 1
+        num_in_tree += 1
+        add_frontier(neighbor)
+
+    # pipe connecting each pair of directions
+    pipes: Dict[str, str] = {
+        "NS": "|",
+        "EW": "-",
+        "EN": "L",
+        "NW": "J",
+        "SW": "7",
+        "ES": "F",
+    }
+
+    def tile(block_row: int, block_col: int, row: int, col: int) -> Optional[str]:
+        """Pipe at (row, col) inside a block, or None if it is not part of the loop."""
+        edges: int = tree_edges[block_row * side + block_col]
+        up: bool = bool(edges & UP_BIT)
+        down: bool = bool(edges & DOWN_BIT)
+        left: bool = bool(edges & LEFT_BIT)
+        right: bool = bool(edges & RIGHT_BIT)
+
+        last: int = BLOCK_SIZE - 1
+
+        # each corner of the block connects along the two sides of the block,
+        # except across a tree edge, where it connects into the next block instead
+        if (row, col) == (0, 0):
+            directions: str = ("N" if up else "E") + ("W" if left else "S")
+        elif (row, col) == (0, last):
+            directions = ("N" if up else "W") + ("E" if right else "S")
+        elif (row, col) == (last, 0):
+            directions = ("S" if down else "E") + ("W" if left else "N")
+        elif (row, col) == (last, last):
+            directions = ("S" if down else "W") + ("E" if right else "N")
+        # sides of the block are straight pipes, unless a tree edge goes through them
+        elif row == 0 and not up or row == last and not down:
+            directions = "EW"
+        elif col == 0 and not left or col == last and not right:
+            directions = "NS"
+        else:
+            return None
+
+        return pipes["".join(sorted(directions))]
+
+    start_row: int = BLOCK_SIZE * (root // side)
+    start_col: int = BLOCK_SIZE * (root % side)
+
+    for row in range(BLOCK_SIZE * side):
+        block_row, row_in_block = divmod(row, BLOCK_SIZE)
+        tiles: List[str] = []
+        for col in range(BLOCK_SIZE * side):
+            block_col, col_in_block = divmod(col, BLOCK_SIZE)
+
+            pipe: Optional[str] = None
+            if in_tree[block_row * side + block_col]:
+                pipe = tile(block_row, block_col, row_in_block, col_in_block)
+
+            if (row, col) == (start_row, start_col):
+                tiles.append("S")
+            elif pipe is not None:
+                tiles.append(pipe)
+            elif abs(row - start_row) + abs(col - start_col) == 1:
+                # junk next to S must not look like it connects to S
+                tiles.append(".")
+            else:
+                tiles.append(rng.choice("|-LJ7F..."))
+
+        yield "".join(tiles)
+
+
+def generate_day16(scale: int, rng: random.Random) -> Iterator[str]:
+    side: int = scaled_side(110, scale)
+
+    for _ in range(side):
+        yield "".join(rng.choices(".|-/\\", weights=[90, 3, 3, 2, 2], k=side))
+
+
+def generate_day22(scale: int, rng: random.Random) -> Iterator[str]:
+    """Snapshot of non-overlapping bricks, each a straight line of cubes."""
+    num_bricks: int = 1323 * scale
+    side: int = scaled_side(10, scale)
+    height: int = 330
+
+    occupied: bytearray = bytearray(side * side * (height + 1))
+
+    def voxels(start: Tuple[int, int, int], axis: int, length: int) -> List[int]:
+        cells: List[int] = []
+        for step in range(length):
+            x, y, z = start
+            if axis == 0:
+                x += step
+            elif axis == 1:
+                y += step
+            else:
+                z += step
+            cells.append((z * side + y) * side + x)
+        return cells
+
+    num_placed: int = 0
+    while num_placed < num_bricks:
+        axis: int = rng.randrange(3)
+        length: int = rng.randint(1, 4)
+        limits: List[int] = [side, side, height + 1]
+        limits[axis] -= length - 1
+        start: Tuple[int, int, int] = (
+            rng.randrange(limits[0]),
+            rng.randrange(limits[1]),
+            rng.randint(1, limits[2] - 1),
+        )
+
+        cells: List[int] = voxels(start, axis, length)
+        if any(occupied[cell] for cell in cells):
+            continue
+        for cell in cells:
+            occupied[cell] = 1
+
+        end: List[int] = list(start)
+        end[axis] += length - 1
+        num_placed += 1
+
+        yield f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}"
+
+
+def generate_day24(scale: int, rng: random.Random) -> Iterator[str]:
+    """Hailstones that a single thrown rock hits, one at a time, so part B has an answer."""
+    rock_position: List[int] = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    rock_velocity: List[int] = [rng.randint(-300, 300) for _ in range(3)]
+
+    collision_times = rng.sample(range(10**11, 10**12), 300 * scale)
+    for collision_time in collision_times:
+        velocity: List[int] = [v + rng.randint(-100, 100) for v in rock_velocity]
+        position: List[int] = [
+            rock_position[i] + (rock_velocity[i] - velocity[i]) * collision_time
+            for i in range(3)
+        ]
+
+        yield (
+            ", ".join(str(p) for p in position)
+            + " @ "
+            + ", ".join(str(v) for v in velocity)
+        )
+
+
+def generate_day25(scale: int, rng: random.Random) -> Iterator[str]:
+    """Two well-connected groups of components, joined by exactly three wires."""
+    num_components: int = 1500 * scale
+    name_length: int = max(3, math.ceil(math.log(2 * num_components, 26)))
+
+    names: List[str] = []
+    used_names = set()
+    while len(names) < num_components:
+        name: str = "".join(rng.choices(string.ascii_lowercase, k=name_length))
+        if name not in used_names:
+            used_names.add(name)
+            names.append(name)
+
+    split: int = rng.randint(num_components // 3, 2 * num_components // 3)
+    groups: List[List[int]] = [list(range(split)), list(range(split, num_components))]
+
+    wires = set()
+
+    def add_wire(a: int, b: int) -> None:
+        if a != b:
+            wires.add((min(a, b), max(a, b)))
+
+    for group in groups:
+        # a ring keeps the group connected; random chords make it hard to cut
+        for i, component in enumerate(group):
+            add_wire(component, group[(i + 1) % len(group)])
+            for other in rng.sample(group, 3):
+                add_wire(component, other)
+
+    num_wires: int = len(wires)
+    while len(wires) < num_wires + 3:
+        add_wire(rng.choice(groups[0]), rng.choice(groups[1]))
+
+    # list each wire once, on the line of one of its ends
+    connections: Dict[int, List[int]] = {}
+    for a, b in wires:
+        if rng.random() < 0.5:
+            a, b = b, a
+        connections.setdefault(a, []).append(b)
+
+    for component in rng.sample(sorted(connections), len(connections)):
+        yield f"{names[component]}: " + " ".join(
+            names[other] for other in connections[component]
+        )
+
+
+GENERATORS: Dict[int, Callable[[int, random.Random], Iterator[str]]] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    10: generate_day10,
+    16: generate_day16,
+    22: generate_day22,
+    24: generate_day24,
+    25: generate_day25,
+}
+
+
+def write_generated_input(day: int, scale: int, seed: int = 0) -> str:
+    """Write the generated input for a day at a given scale and return its path."""
+    rng: random.Random = random.Random(f"{day}-{scale}-{seed}")
+    path: str = generated_input_path(day, scale)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fd:
+        for line in GENERATORS[day](scale, rng):
+            fd.write(line)
+            fd.write("\n")
+
+    return path
+
+
+def ensure_generated_input(day: int, scale: int, seed: int = 0) -> str:
+    """Return the path of a generated input, generating it first if needed."""
+    path: str = generated_input_path(day, scale)
+    if not os.path.exists(path):
+        write_generated_input(day, scale, seed)
+
+    return path
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate scaled-up puzzle inputs.")
+    parser.add_argument(
+        "days",
+        nargs="*",
+        type=int,
+        help=f"days to generate inputs for (default: {sorted(GENERATORS)})",
+    )
+    parser.add_argument(
+        "--scale",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SCALES,
+        help=f"how many times larger than the real input (default: {DEFAULT_SCALES})",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args: argparse.Namespace = parse_args(argv)
+
+    for day in args.days or sorted(GENERATORS):
+        if day not in GENERATORS:
+            raise ValueError(f"No generator for day {day}")
+
+        for scale in args.scale:
+            path: str = write_generated_input(day, scale, args.seed)
+            print(f"Wrote {os.path.relpath(path, runner.REPO_DIRECTORY)}")
+
+
+if __name__ == "__main__":
+    main()
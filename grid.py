@@ -0,0 +1,130 @@
+"""Compact grid of characters shared by the grid-based days.
+
+A List[List[str]] board costs a pointer plus list overhead for every cell. Grid
+keeps all cells in one bytearray, row after row, so a cell is a single byte and
+whole rows and columns can be handled with bytes operations (slicing, comparing,
+counting, translate) instead of per-cell Python loops.
+
+Cells are read and written as one-character strings, like the boards they
+replace: grid[row, col] == "#" and grid[row, col] = ".".
+"""
+
+from typing import Iterator, List, Optional, Tuple
+
+from puzzle_input import InputFile
+
+# one-character string for each byte value, so reading a cell never allocates
+_CHARS: List[str] = [chr(value) for value in range(256)]
+
+# (row change, column change) of the 4 orthogonal and 8 surrounding neighbors
+ORTHOGONAL_STEPS: List[Tuple[int, int]] = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+ALL_STEPS: List[Tuple[int, int]] = [
+    (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+]
+
+
+class Grid:
+    def __init__(self, rows: int, cols: int, data: Optional[bytearray] = None):
+        if data is None:
+            data = bytearray(b"." * (rows * cols))
+        if len(data) != rows * cols:
+            raise ValueError(f"{len(data)} cells do not make a {rows}x{cols} grid")
+
+        self.rows: int = rows
+        self.cols: int = cols
+        self.data: bytearray = data
+
+    @classmethod
+    def from_lines(cls, lines: List[str]) -> "Grid":
+        """Grid from equally long lines. Trailing blank lines are ignored."""
+        while lines and lines[-1] == "":
+            lines = lines[:-1]
+        if not lines:
+            return cls(0, 0)
+
+        cols: int = len(lines[0])
+        for index, line in enumerate(lines):
+            if len(line) != cols:
+                raise ValueError(f"Line {index + 1} has {len(line)} cells, not {cols}")
+
+        return cls(len(lines), cols, bytearray("".join(lines).encode()))
+
+    @classmethod
+    def from_file(cls, path: str) -> "Grid":
+        """Grid from an input file, copying the file's bytes only once."""
+        with InputFile(path) as input_file:
+            view = input_file.grid()
+            data: bytearray = bytearray(view.rows * view.cols)
+            for row in range(view.rows):
+                data[row * view.cols : (row + 1) * view.cols] = view.row(row)
+            rows, cols = view.rows, view.cols
+            del view
+
+        return cls(rows, cols, data)
+
+    def __getitem__(self, position: Tuple[int, int]) -> str:
+        row, col = position
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f"{position} is outside a {self.rows}x{self.cols} grid")
+        return _CHARS[self.data[row * self.cols + col]]
+
+    def __setitem__(self, position: Tuple[int, int], value: str) -> None:
+        row, col = position
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f"{position} is outside a {self.rows}x{self.cols} grid")
+        self.data[row * self.cols + col] = ord(value)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Grid)
+            and self.rows == other.rows
+            and self.cols == other.cols
+            and self.data == other.data
+        )
+
+    def __str__(self) -> str:
+        return "\n".join(self.row(row).decode() for row in range(self.rows))
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def row(self, row: int) -> bytes:
+        """Copy of a row's cells."""
+        if not 0 <= row < self.rows:
+            raise IndexError(f"Row {row} is outside a grid of {self.rows} rows")
+        start: int = row * self.cols
+        return bytes(self.data[start : start + self.cols])
+
+    def column(self, col: int) -> bytes:
+        """Copy of a column's cells."""
+        if not 0 <= col < self.cols:
+            raise IndexError(f"Column {col} is outside a grid of {self.cols} columns")
+        return bytes(self.data[col :: self.cols])
+
+    def neighbors(
+        self, row: int, col: int, diagonal: bool = False
+    ) -> Iterator[Tuple[int, int]]:
+        """Positions next to (row, col) that are inside the grid."""
+        for dr, dc in ALL_STEPS if diagonal else ORTHOGONAL_STEPS:
+            if 0 <= row + dr < self.rows and 0 <= col + dc < self.cols:
+                yield (row + dr, col + dc)
+
+    def find(self, value: str) -> Optional[Tuple[int, int]]:
+        index: int = self.data.find(ord(value))
+        if index == -1:
+            return None
+        return divmod(index, self.cols)
+
+    def count(self, value: str) -> int:
+        return self.data.count(ord(value))
+
+    def copy(self) -> "Grid":
+        return Grid(self.rows, self.cols, bytearray(self.data))
+
+    def transpose(self) -> "Grid":
+        # each column of this grid, read with a stride, is a row of the transpose
+        return Grid(
+            self.cols,
+            self.rows,
+            bytearray(b"".join(self.column(col) for col in range(self.cols))),
+        )
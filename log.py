@@ -0,0 +1,145 @@
+"""Logger for the solvers that only imports loguru once something is logged.
+
+Importing loguru pulls in asyncio, logging, inspect and friends, which takes longer
+than solving most of the fast days. Solvers do `from log import logger` and use
+it like loguru's logger; loguru itself is imported on the first message that gets
+through.
+
+time_solver() lives here too, rather than in runner.py, so that running a solver
+does not import the runner's process pool and argument parsing.
+
+Messages below the level in the AOC_LOG_LEVEL environment variable are dropped
+without importing anything. runner.py turns logging off when the solvers' output
+is thrown away anyway, so a fast day never imports loguru at all.
+
+For timing runs, "python -O runner.py" (or benchmark.py) goes one step further:
+debug logging is compiled out of the hot loops instead of being skipped.
+"""
+
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+LEVEL_ENVIRONMENT_VARIABLE: str = "AOC_LOG_LEVEL"
+
+# "python -O" runs in production mode: trace and debug calls become no-ops, and
+# debug sites in hot loops, guarded by `if __debug__:`, are not even compiled
+PRODUCTION: bool = not __debug__
+
+# loguru's severities, plus OFF to drop everything
+LEVELS: Dict[str, int] = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+    "OFF": 100,
+}
+
+
+def level_from_environment() -> int:
+    name: str = os.environ.get(LEVEL_ENVIRONMENT_VARIABLE, "TRACE").upper()
+    if name not in LEVELS:
+        raise ValueError(
+            f"{LEVEL_ENVIRONMENT_VARIABLE}={name!r} is not one of {', '.join(LEVELS)}"
+        )
+    return LEVELS[name]
+
+
+def _discard(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+class LazyLogger:
+    """Level-gated stand-in for loguru's logger.
+
+    Pass values as arguments instead of formatting them into an f-string, like
+    logger.debug("mapping={} resulted in {}", mapping, result): a dropped message
+    then costs one comparison, and nothing is formatted. When the arguments are
+    expensive to build, pass them all as functions with lazy=True, as in
+    logger.debug("ranges: {}", lambda: [str(r) for r in ranges], lazy=True).
+    """
+
+    def __init__(self):
+        self.min_level: int = level_from_environment()
+        self._loguru: Optional[Any] = None
+
+        if PRODUCTION:
+            self.min_level = max(self.min_level, LEVELS["INFO"])
+            self.trace = _discard
+            self.debug = _discard
+
+    @property
+    def loguru(self) -> Any:
+        """loguru's logger, imported on first use."""
+        if self._loguru is None:
+            from loguru import logger
+
+            self._loguru = logger
+        return self._loguru
+
+    def set_level(self, name: str) -> None:
+        self.min_level = LEVELS[name.upper()]
+
+    def is_enabled(self, level: str) -> bool:
+        return LEVELS[level] >= self.min_level
+
+    def _emit(
+        self, level: str, message: str, args: Tuple, kwargs: Dict[str, Any]
+    ) -> None:
+        lazy: bool = kwargs.pop("lazy", False)
+        # depth=2 makes loguru report the solver's line, not this file's
+        self.loguru.opt(depth=2, lazy=lazy).log(level, message, *args, **kwargs)
+
+    # each level compares against min_level itself, so a dropped message costs a
+    # single method call
+
+    def trace(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.min_level <= 5:
+            self._emit("TRACE", message, args, kwargs)
+
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.min_level <= 10:
+            self._emit("DEBUG", message, args, kwargs)
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.min_level <= 20:
+            self._emit("INFO", message, args, kwargs)
+
+    def success(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.min_level <= 25:
+            self._emit("SUCCESS", message, args, kwargs)
+
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.min_level <= 30:
+            self._emit("WARNING", message, args, kwargs)
+
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.min_level <= 40:
+            self._emit("ERROR", message, args, kwargs)
+
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.min_level <= 50:
+            self._emit("CRITICAL", message, args, kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # anything else (remove, add, opt, ...) goes straight to loguru
+        return getattr(self.loguru, name)
+
+
+logger: LazyLogger = LazyLogger()
+
+
+def time_solver(main: Callable[[], Any]) -> None:
+    """Run a solver's main() and log the wall time it took.
+
+    Used by the `if __name__ == "__main__"` block of every day.
+    """
+    start_time: float = time.time()
+    main()
+
+    time_took: float = time.time() - start_time
+    seconds_took: int = int(time_took)
+    logger.info(f"Took {seconds_took}s {1000 * (time_took - seconds_took):.3f}ms")
@@ -0,0 +1,263 @@
+"""Opt-in profiling of the solvers' hot functions.
+
+Decorate a function with @profiled, or wrap a block in `with profile_section(name):`,
+to count its calls and total its time. Recursive calls are counted, but only
+the outermost call is timed, so a recursive function's time is not counted more
+than once.
+
+Profiling is off unless the AOC_PROFILE environment variable is set, and then
+@profiled hands back the undecorated function, so it costs nothing. Turn it on
+with "$ AOC_PROFILE=1 python3 day17A.py" or "$ python3 runner.py --profile 17A".
+While on, the whole process is also sampled on a CPU-time timer. When the
+process exits, the call counts are printed and saved as .aoc_cache/profiles/<name>.txt,
+and the samples are written next to them in two formats: <name>.collapsed holds
+folded stacks for flamegraph.pl and similar tools, and <name>.speedscope.json
+opens in https://www.speedscope.app.
+"""
+
+import atexit
+import functools
+import json
+import os
+import signal
+import sys
+import time
+from contextlib import contextmanager
+from types import FrameType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+PROFILE_ENVIRONMENT_VARIABLE: str = "AOC_PROFILE"
+PROFILE_DIRECTORY: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".aoc_cache", "profiles"
+)
+
+# seconds of CPU time between stack samples
+SAMPLE_INTERVAL: float = 0.001
+
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+
+class CallStats:
+    def __init__(self, name: str):
+        self.name: str = name
+        self.calls: int = 0
+        self.seconds: float = 0.0
+        # calls currently running, so only the outermost one of a recursion is timed
+        self.active: int = 0
+
+
+class Profiler:
+    def __init__(self, name: str):
+        self.name: str = name
+        self.stats: Dict[str, CallStats] = {}
+        # folded stack (outermost frame first, joined by ";") -> times sampled
+        self.samples: Dict[str, int] = {}
+        # folded stack -> CPU seconds it was seen for. The timer fires less often
+        # than asked for on coarse kernel clocks, so samples are weighted by the
+        # CPU time that actually passed since the previous one
+        self.sample_seconds: Dict[str, float] = {}
+        self.sampling: bool = False
+        self.last_sample_time: float = 0.0
+
+    def stats_for(self, name: str) -> CallStats:
+        if name not in self.stats:
+            self.stats[name] = CallStats(name)
+        return self.stats[name]
+
+    def start_sampling(self, interval: float = SAMPLE_INTERVAL) -> None:
+        if not hasattr(signal, "setitimer"):
+            print("Stack sampling needs signal.setitimer; skipping it", file=sys.stderr)
+            return
+
+        signal.signal(signal.SIGPROF, self._take_sample)
+        self.last_sample_time = time.process_time()
+        signal.setitimer(signal.ITIMER_PROF, interval, interval)
+        self.sampling = True
+
+    def stop_sampling(self) -> None:
+        if self.sampling:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            self.sampling = False
+
+    def _take_sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        names: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(
+                f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            )
+            frame = frame.f_back
+
+        now: float = time.process_time()
+        stack: str = ";".join(reversed(names))
+        self.samples[stack] = self.samples.get(stack, 0) + 1
+        self.sample_seconds[stack] = (
+            self.sample_seconds.get(stack, 0.0) + now - self.last_sample_time
+        )
+        self.last_sample_time = now
+
+    def report(self) -> str:
+        width: int = max([len("function")] + [len(name) for name in self.stats])
+        lines: List[str] = [
+            f"{'function':<{width}} {'calls':>12} {'total (s)':>10} {'per call (us)':>14}"
+        ]
+
+        for stats in sorted(self.stats.values(), key=lambda stats: -stats.seconds):
+            per_call: float = 1e6 * stats.seconds / stats.calls if stats.calls else 0.0
+            lines.append(
+                f"{stats.name:<{width}} {stats.calls:>12} {stats.seconds:>10.3f} {per_call:>14.2f}"
+            )
+
+        return "\n".join(lines)
+
+    def collapsed(self) -> str:
+        """Samples in the folded format of flamegraph.pl: "outer;inner count"."""
+        return "\n".join(
+            f"{stack} {count}" for stack, count in sorted(self.samples.items())
+        )
+
+    def speedscope(self) -> Dict[str, Any]:
+        """Samples as a speedscope "sampled" profile, weighted in CPU seconds."""
+        frame_indices: Dict[str, int] = {}
+        frames: List[Dict[str, Any]] = []
+        samples: List[List[int]] = []
+        weights: List[float] = []
+
+        for stack in sorted(self.samples):
+            indices: List[int] = []
+            for frame_name in stack.split(";"):
+                if frame_name not in frame_indices:
+                    function_name, _, location = frame_name.rpartition(" (")
+                    file_name, _, line = location.rstrip(")").rpartition(":")
+                    frame_indices[frame_name] = len(frames)
+                    frames.append(
+                        {"name": function_name, "file": file_name, "line": int(line)}
+                    )
+                indices.append(frame_indices[frame_name])
+
+            samples.append(indices)
+            weights.append(self.sample_seconds[stack])
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": "profiler.py",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": self.name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+    def write(self, directory: str = PROFILE_DIRECTORY) -> Tuple[str, str, str]:
+        """Write the call counts and samples out, returning the files' paths."""
+        os.makedirs(directory, exist_ok=True)
+
+        report_path: str = os.path.join(directory, f"{self.name}.txt")
+        with open(report_path, "w") as fd:
+            fd.write(self.report() + "\n")
+
+        collapsed_path: str = os.path.join(directory, f"{self.name}.collapsed")
+        with open(collapsed_path, "w") as fd:
+            fd.write(self.collapsed() + "\n")
+
+        speedscope_path: str = os.path.join(directory, f"{self.name}.speedscope.json")
+        with open(speedscope_path, "w") as fd:
+            json.dump(self.speedscope(), fd)
+
+        return report_path, collapsed_path, speedscope_path
+
+
+def _profile_name() -> str:
+    """Name of the profile: AOC_PROFILE if it names one, else the script's name."""
+    value: str = os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, "")
+    if value not in ("", "0", "1"):
+        return value
+    return os.path.splitext(os.path.basename(sys.argv[0]))[0] or "profile"
+
+
+# the profiler for this process, or None when profiling is off
+PROFILER: Optional[Profiler] = None
+
+
+def enable(name: str) -> Profiler:
+    """Turn profiling on. Only functions decorated after this are profiled."""
+    global PROFILER
+
+    if PROFILER is None:
+        PROFILER = Profiler(name)
+        PROFILER.start_sampling()
+        atexit.register(finish)
+
+    return PROFILER
+
+
+def finish() -> None:
+    """Stop profiling, print the call counts and write everything out."""
+    global PROFILER
+
+    if PROFILER is None:
+        return
+    PROFILER.stop_sampling()
+
+    paths: Tuple[str, str, str] = PROFILER.write()
+    print(PROFILER.report(), file=sys.stderr)
+    print(f"Wrote {', '.join(paths)}", file=sys.stderr)
+
+    PROFILER = None
+
+
+if os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, "0") != "0":
+    enable(_profile_name())
+
+
+def profiled(function: Function) -> Function:
+    """Count calls to `function` and time them, when profiling is on."""
+    if PROFILER is None:
+        return function
+
+    stats: CallStats = PROFILER.stats_for(
+        f"{function.__module__}.{function.__qualname__}"
+    )
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        stats.calls += 1
+        if stats.active:
+            return function(*args, **kwargs)
+
+        stats.active += 1
+        start_time: float = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.seconds += time.perf_counter() - start_time
+            stats.active -= 1
+
+    return wrapper  # type: ignore
+
+
+@contextmanager
+def profile_section(name: str) -> Iterator[None]:
+    """Count and time a block of code under `name`, when profiling is on."""
+    if PROFILER is None:
+        yield
+        return
+
+    stats: CallStats = PROFILER.stats_for(name)
+    stats.calls += 1
+    stats.active += 1
+    start_time: float = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stats.active == 1:
+            stats.seconds += time.perf_counter() - start_time
+        stats.active -= 1
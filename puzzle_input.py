@@ -0,0 +1,120 @@
+"""Shared readers for the puzzle inputs.
+
+read_lines() is the drop-in for the solvers that want a List[str]: the stripped
+lines, built by iterating over the open file rather than through readlines(),
+so the unstripped lines are never all held at once.
+
+InputFile memory-maps a file for Grid.from_file. Its grid() gives a ByteGrid
+that hands out rows straight out of the file's bytes, so a board is
+copied once, into the Grid, instead of going through a list of lines first.
+"""
+
+import mmap
+from array import array
+from typing import List, Optional
+
+
+class ByteGrid:
+    """Read-only view of a rectangular grid stored as lines of equal length,
+    handing out its rows as memoryviews.
+    """
+
+    def __init__(self, data: memoryview, rows: int, cols: int, stride: int):
+        self.data: memoryview = data
+        self.rows: int = rows
+        self.cols: int = cols
+        # bytes from the start of one row to the start of the next
+        self.stride: int = stride
+
+    def row(self, row: int) -> memoryview:
+        start: int = row * self.stride
+        return self.data[start : start + self.cols]
+
+
+class InputFile:
+    """Memory-mapped input file. Use as a context manager, or call close().
+
+    Views handed out by this class point into the map, so release them (or let
+    them go out of scope) before closing.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self._fd = open(path, "rb")
+        self._mmap: Optional[mmap.mmap] = None
+
+        try:
+            self._mmap = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+            self.data: memoryview = memoryview(self._mmap)
+        except ValueError:
+            # empty files cannot be mapped
+            self.data = memoryview(b"")
+
+        # start offsets of each line, and one past the end of the last line
+        self.line_starts: array = array("q", [0])
+        position: int = 0
+        size: int = len(self.data)
+        while position < size:
+            newline: int = (
+                self._mmap.find(b"\n", position) if self._mmap is not None else -1
+            )
+            position = size if newline == -1 else newline + 1
+            self.line_starts.append(position)
+
+    def __enter__(self) -> "InputFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.data.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._fd.close()
+
+    def __len__(self) -> int:
+        return len(self.line_starts) - 1
+
+    def line(self, index: int) -> memoryview:
+        """Line `index` without its line ending."""
+        start: int = self.line_starts[index]
+        end: int = self.line_starts[index + 1]
+
+        while end > start and self.data[end - 1] in (ord("\n"), ord("\r")):
+            end -= 1
+
+        return self.data[start:end]
+
+    def grid(self) -> ByteGrid:
+        """View the file as a grid, with every line the same length."""
+        num_rows: int = len(self)
+        if num_rows == 0:
+            return ByteGrid(self.data, 0, 0, 0)
+
+        cols: int = len(self.line(0))
+        # the line ending of the first line tells how far apart rows are
+        stride: int = self.line_starts[1] - self.line_starts[0]
+
+        # a trailing blank line is not a row
+        while num_rows > 0 and len(self.line(num_rows - 1)) == 0:
+            num_rows -= 1
+
+        for index in range(num_rows):
+            if (
+                len(self.line(index)) != cols
+                or self.line_starts[index] != index * stride
+            ):
+                raise ValueError(
+                    f"{self.path} is not a grid: line {index + 1} does not match line 1"
+                )
+
+        return ByteGrid(self.data, num_rows, cols, stride)
+
+
+def read_lines(path: str) -> List[str]:
+    """Lines of a file as stripped strings, like [line.strip() for line in fd.readlines()]
+    but without first building the list of unstripped lines.
+    """
+    with open(path, "r") as fd:
+        return [line.strip() for line in fd]
@@ -0,0 +1,103 @@
+"""Cache of the solvers' answers, so re-checking a day does not re-solve it.
+
+An answer is stored under the SHA-256 of the solver's source and the SHA-256 of
+the input file it read. Editing the solver or changing the input gives a new key,
+so a stale answer is never handed back; the old entry just stops being used and
+is eventually evicted. Only the solver's own file is hashed, not the helper
+modules it imports, so after changing grid.py or puzzle_input.py run with
+"--no-cache" (or "--clear-cache") to be sure.
+
+Entries live in .aoc_cache/results.json. Each records when it was last used, and
+once there are more than MAX_ENTRIES the least recently used ones are dropped.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+REPO_DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILE: str = os.path.join(REPO_DIRECTORY, ".aoc_cache", "results.json")
+
+# answers kept before the least recently used ones are evicted
+MAX_ENTRIES: int = 256
+
+# bytes hashed at a time, so generated inputs are not read into memory at once
+HASH_CHUNK_SIZE: int = 1 << 20
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fd:
+        while chunk := fd.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def input_path(name: str, debug: bool = False) -> str:
+    """Input file the solver `name` reads, like inputs/day05.txt for day05B."""
+    file_name: str = "dummy.txt" if debug else f"day{name[3:5]}.txt"
+    return os.path.join(REPO_DIRECTORY, "inputs", file_name)
+
+
+def cache_key(name: str, debug: bool = False) -> Optional[str]:
+    """Key for the solver's answer on its current input, or None without an input."""
+    path: str = input_path(name, debug)
+    if not os.path.exists(path):
+        return None
+
+    source_hash: str = file_sha256(os.path.join(REPO_DIRECTORY, f"{name}.py"))
+    return f"{name}:{source_hash}:{file_sha256(path)}"
+
+
+class ResultCache:
+    def __init__(self, path: str = RESULTS_FILE, max_entries: int = MAX_ENTRIES):
+        self.path: str = path
+        self.max_entries: int = max_entries
+        # key -> {"answer": ..., "last_used": seconds since the epoch}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+        if os.path.exists(path):
+            with open(path, "r") as fd:
+                self.entries = json.load(fd)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The entry stored under `key`, marked as just used, or None."""
+        entry: Optional[Dict[str, Any]] = self.entries.get(key)
+        if entry is not None:
+            entry["last_used"] = time.time()
+        return entry
+
+    def put(self, key: str, answer: Any) -> bool:
+        """Store an answer. Answers that JSON cannot hold are not cached."""
+        try:
+            json.dumps(answer)
+        except (TypeError, ValueError):
+            return False
+
+        self.entries[key] = {"answer": answer, "last_used": time.time()}
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Drop the least recently used entries until at most max_entries remain."""
+        if len(self.entries) <= self.max_entries:
+            return
+
+        by_last_use = sorted(
+            self.entries, key=lambda key: self.entries[key]["last_used"]
+        )
+        for key in by_last_use[: len(self.entries) - self.max_entries]:
+            del self.entries[key]
+
+    def clear(self) -> None:
+        self.entries = {}
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as fd:
+            json.dump(self.entries, fd, indent=4, sort_keys=True)
@@ -0,0 +1,522 @@
+"""Run the day solvers and report how long each one took.
+
+Run every solver with "$ python3 runner.py", or pass day selectors to run a
+subset: "$ python3 runner.py 5 07B day17A" runs both parts of day 5, part B of
+day 7 and part A of day 17.
+
+Each solver runs in a fresh interpreter so that its CPU time and peak memory
+are not mixed up with the solvers that ran before it. Pass "--jobs N" to run
+solvers on N cores at once; the slowest solvers (going by earlier runs) are
+started first, so the whole suite takes about as long as the slowest solver.
+
+Answers are cached by the hashes of the solver's source and its input, so
+re-running a day that has not changed prints its answer right away. Pass
+"--no-cache" to solve anyway, or "--clear-cache" to forget every cached answer.
+"""
+
+import argparse
+import concurrent.futures
+import importlib
+import json
+import multiprocessing
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+import traceback
+from typing import Any, Dict, List, Optional, Tuple
+
+import profiler
+from log import logger
+from result_cache import ResultCache, cache_key
+
+SOLVER_PATTERN: re.Pattern = re.compile(r"^day(\d{2})([AB])\.py$")
+SELECTOR_PATTERN: re.Pattern = re.compile(r"^(?:day)?(\d{1,2})([AB])?$", re.IGNORECASE)
+
+REPO_DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIRECTORY: str = os.path.join(REPO_DIRECTORY, ".aoc_cache")
+RUNTIMES_FILE: str = os.path.join(CACHE_DIRECTORY, "runtimes.json")
+
+# one line of "python -X importtime" output:
+# "import time: <self us> | <cumulative us> | <2 spaces per nesting level><module>"
+IMPORT_TIME_PATTERN: re.Pattern = re.compile(
+    r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$"
+)
+
+# solvers should be imported and ready to solve within this many milliseconds
+STARTUP_BUDGET_MS: float = 50.0
+
+# runtimes noted in the solvers themselves, used until a run is recorded
+KNOWN_RUNTIMES: Dict[str, float] = {
+    "day21B": 435.789,
+    "day23B": 277.029,
+}
+
+
+class SolverResult:
+    def __init__(
+        self,
+        name: str,
+        answer: Any = None,
+        wall_seconds: float = 0.0,
+        cpu_seconds: float = 0.0,
+        peak_rss_kb: int = 0,
+        error: Optional[str] = None,
+        cached: bool = False,
+    ):
+        self.name: str = name
+        self.answer: Any = answer
+        self.wall_seconds: float = wall_seconds
+        self.cpu_seconds: float = cpu_seconds
+        self.peak_rss_kb: int = peak_rss_kb
+        self.error: Optional[str] = error
+        # the answer came from the result cache, so nothing was run or timed
+        self.cached: bool = cached
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class StartupResult:
+    def __init__(
+        self,
+        name: str,
+        startup_seconds: float,
+        import_microseconds: int,
+        direct_imports: List[Tuple[str, int]],
+    ):
+        self.name: str = name
+        # wall time of a fresh interpreter that only imports the solver
+        self.startup_seconds: float = startup_seconds
+        # time spent importing the solver module and everything it imports
+        self.import_microseconds: int = import_microseconds
+        # (module, cumulative microseconds) of what the solver imports itself
+        self.direct_imports: List[Tuple[str, int]] = direct_imports
+
+
+def discover_solvers(directory: str = REPO_DIRECTORY) -> List[str]:
+    """Return the module names of all Python solvers, like ["day01B", "day02A", ...]."""
+    names: List[str] = []
+
+    for file_name in os.listdir(directory):
+        if SOLVER_PATTERN.match(file_name):
+            names.append(file_name[: -len(".py")])
+
+    return sorted(names)
+
+
+def select_solvers(all_solvers: List[str], selectors: List[str]) -> List[str]:
+    """Filter solvers by selectors such as "5", "05", "05B" or "day05B".
+
+    A selector without a part matches both parts of that day.
+    """
+    if not selectors:
+        return list(all_solvers)
+
+    wanted: List[str] = []
+    for selector in selectors:
+        match = SELECTOR_PATTERN.match(selector)
+        if match is None:
+            raise ValueError(f"Cannot understand solver selector {selector!r}")
+
+        day: int = int(match.group(1))
+        part: Optional[str] = match.group(2)
+        prefix: str = f"day{day:02d}" + (part.upper() if part else "")
+
+        matching: List[str] = [name for name in all_solvers if name.startswith(prefix)]
+        if not matching:
+            raise ValueError(f"No solver matches selector {selector!r}")
+
+        for name in matching:
+            if name not in wanted:
+                wanted.append(name)
+
+    return sorted(wanted)
+
+
+def _peak_rss_kb() -> int:
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    if sys.platform == "darwin":
+        peak //= 1024
+
+    return peak
+
+
+def _run_in_child(
+    name: str, debug: bool, show_output: bool, profile: bool = False
+) -> SolverResult:
+    """Import and run one solver. Meant to be run inside a fresh worker process."""
+    os.chdir(REPO_DIRECTORY)
+    if REPO_DIRECTORY not in sys.path:
+        sys.path.insert(0, REPO_DIRECTORY)
+
+    # some solvers drop into the debugger when done
+    os.environ["PYTHONBREAKPOINT"] = "0"
+
+    if profile:
+        # before the import, so the solver's @profiled functions get wrapped
+        profiler.enable(name)
+
+    if not show_output:
+        devnull: int = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        # nobody reads the logs, so do not even import loguru
+        logger.set_level("OFF")
+
+    module = importlib.import_module(name)
+    if debug:
+        module.DEBUG = True
+
+    answer: Any = None
+    error: Optional[str] = None
+
+    wall_start: float = time.perf_counter()
+    cpu_start: float = time.process_time()
+    try:
+        answer = module.main()
+    except Exception:
+        error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+    cpu_seconds: float = time.process_time() - cpu_start
+    wall_seconds: float = time.perf_counter() - wall_start
+
+    if profile:
+        profiler.finish()
+
+    return SolverResult(name, answer, wall_seconds, cpu_seconds, _peak_rss_kb(), error)
+
+
+def load_runtimes(path: str = RUNTIMES_FILE) -> Dict[str, float]:
+    """Return the wall time of the last successful run of each solver."""
+    runtimes: Dict[str, float] = dict(KNOWN_RUNTIMES)
+
+    if os.path.exists(path):
+        with open(path, "r") as fd:
+            runtimes.update(json.load(fd))
+
+    return runtimes
+
+
+def save_runtimes(results: List[SolverResult], path: str = RUNTIMES_FILE) -> None:
+    runtimes: Dict[str, float] = {}
+    if os.path.exists(path):
+        with open(path, "r") as fd:
+            runtimes = json.load(fd)
+
+    for result in results:
+        if result.ok and not result.cached:
+            runtimes[result.name] = result.wall_seconds
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fd:
+        json.dump(runtimes, fd, indent=4, sort_keys=True)
+
+
+def longest_first(names: List[str], runtimes: Dict[str, float]) -> List[str]:
+    """Order solvers so the ones expected to take longest start first.
+
+    Solvers that have never been timed go to the front, since they could be slow.
+    """
+    return sorted(names, key=lambda name: -runtimes.get(name, float("inf")))
+
+
+def run_solver(
+    name: str, debug: bool = False, show_output: bool = False, profile: bool = False
+) -> SolverResult:
+    """Run a single solver in a fresh interpreter and measure it."""
+    return run_solvers([name], debug, show_output, profile=profile)[0]
+
+
+def run_solvers(
+    names: List[str],
+    debug: bool = False,
+    show_output: bool = False,
+    jobs: int = 1,
+    profile: bool = False,
+    cache: Optional[ResultCache] = None,
+    read_cache: bool = True,
+) -> List[SolverResult]:
+    """Run solvers in a pool of `jobs` worker processes, each solver in a fresh worker.
+
+    Whenever a worker frees up it takes the next solver in line, so with the slowest
+    solvers queued first the short ones fill in the gaps around them.
+
+    With a `cache`, solvers whose answer is cached are not run (unless `read_cache`
+    is False), and the answers of the ones that are run get stored in it.
+    """
+    results: Dict[str, SolverResult] = {}
+
+    keys: Dict[str, Optional[str]] = {}
+    if cache is not None:
+        for name in names:
+            keys[name] = cache_key(name, debug)
+            entry = cache.get(keys[name]) if read_cache and keys[name] else None
+            if entry is not None:
+                results[name] = SolverResult(name, entry["answer"], cached=True)
+
+    to_run: List[str] = [name for name in names if name not in results]
+    queued: List[str] = to_run if jobs == 1 else longest_first(to_run, load_runtimes())
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as executor:
+        futures: Dict[concurrent.futures.Future, str] = {}
+        for name in queued:
+            futures[
+                executor.submit(_run_in_child, name, debug, show_output, profile)
+            ] = name
+
+        for future in concurrent.futures.as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = SolverResult(name, error=f"worker died: {e!r}")
+            logger.debug(f"Finished {name}")
+
+    # timings on the dummy input say nothing about the real one, and profiled
+    # runs are slowed down by the profiler
+    if not debug and not profile:
+        save_runtimes(list(results.values()))
+
+    if cache is not None:
+        for name in to_run:
+            key: Optional[str] = keys[name]
+            if key is not None and results[name].ok:
+                cache.put(key, results[name].answer)
+        cache.save()
+
+    return [results[name] for name in names]
+
+
+def parse_import_times(output: str, name: str) -> Tuple[int, List[Tuple[str, int]]]:
+    """Cumulative import time of module `name`, and of each module it imports
+    directly, from the stderr of "python -X importtime".
+    """
+    total: int = 0
+    direct_imports: List[Tuple[str, int]] = []
+
+    # a module's line comes after the lines of everything it imports
+    pending: List[Tuple[str, int, int]] = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+
+        cumulative: int = int(match.group(2))
+        depth: int = len(match.group(3)) // 2
+        module: str = match.group(4)
+
+        if depth == 0:
+            if module == name:
+                total = cumulative
+                direct_imports = [
+                    (child, child_cumulative)
+                    for child, child_cumulative, child_depth in pending
+                    if child_depth == 1
+                ]
+            pending = []
+        else:
+            pending.append((module, cumulative, depth))
+
+    return total, direct_imports
+
+
+def measure_startup(name: str, runs: int = 3) -> StartupResult:
+    """Time a fresh interpreter importing the solver, keeping the fastest of `runs`."""
+    best: Optional[StartupResult] = None
+
+    for _ in range(runs):
+        start_time: float = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {name}"],
+            cwd=REPO_DIRECTORY,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        startup_seconds: float = time.perf_counter() - start_time
+
+        total, direct_imports = parse_import_times(completed.stderr, name)
+        if best is None or startup_seconds < best.startup_seconds:
+            best = StartupResult(name, startup_seconds, total, direct_imports)
+
+    assert best is not None
+    return best
+
+
+def format_startup_table(results: List[StartupResult], budget_ms: float) -> str:
+    lines: List[str] = [
+        f"{'solver':<8} {'startup (ms)':>12} {'imports (ms)':>12}  heaviest imports"
+    ]
+
+    for result in results:
+        heaviest: List[Tuple[str, int]] = sorted(
+            result.direct_imports, key=lambda item: -item[1]
+        )[:3]
+        breakdown: str = ", ".join(
+            f"{module} {microseconds / 1000:.1f}" for module, microseconds in heaviest
+        )
+        flag: str = "  OVER BUDGET" if 1000 * result.startup_seconds > budget_ms else ""
+
+        lines.append(
+            f"{result.name:<8} {1000 * result.startup_seconds:>12.1f} {result.import_microseconds / 1000:>12.1f}  {breakdown}{flag}"
+        )
+
+    return "\n".join(lines)
+
+
+def format_table(results: List[SolverResult]) -> str:
+    headers: List[str] = ["solver", "answer", "wall (s)", "cpu (s)", "peak RSS (MiB)"]
+    rows: List[List[str]] = []
+
+    for result in results:
+        answer: str = str(result.answer) if result.ok else f"ERROR: {result.error}"
+        if result.cached:
+            answer += " (cached)"
+
+        rows.append(
+            [
+                result.name,
+                answer,
+                f"{result.wall_seconds:.3f}",
+                f"{result.cpu_seconds:.3f}",
+                f"{result.peak_rss_kb / 1024:.1f}",
+            ]
+        )
+
+    total_wall: float = sum(result.wall_seconds for result in results)
+    total_cpu: float = sum(result.cpu_seconds for result in results)
+    peak: int = max((result.peak_rss_kb for result in results), default=0)
+    rows.append(
+        ["total", "", f"{total_wall:.3f}", f"{total_cpu:.3f}", f"{peak / 1024:.1f}"]
+    )
+
+    widths: List[int] = [
+        max(len(row[i]) for row in rows + [headers]) for i in range(len(headers))
+    ]
+
+    def format_row(row: List[str]) -> str:
+        # left-align names and answers, right-align numbers
+        cells: List[str] = [
+            cell.ljust(width) if i < 2 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ]
+        return "  ".join(cells).rstrip()
+
+    lines: List[str] = [format_row(headers)]
+    lines.append("  ".join("-" * width for width in widths))
+    lines.extend(format_row(row) for row in rows[:-1])
+    lines.append("  ".join("-" * width for width in widths))
+    lines.append(format_row(rows[-1]))
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run and time the day solvers.")
+    parser.add_argument(
+        "selectors",
+        nargs="*",
+        help='days to run, like "5", "05B" or "day17A" (default: all)',
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="set DEBUG in each solver, so it reads inputs/dummy.txt",
+    )
+    parser.add_argument(
+        "--show-output",
+        action="store_true",
+        help="let the solvers print and log to the terminal",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of solvers to run at once (default: 1; 0 means one per core)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="count calls to @profiled functions and sample stacks into .aoc_cache/profiles/",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="solve even when the answer is cached, and cache the new answer",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="forget every cached answer before running",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="only list the selected solvers"
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="instead of solving, report how long each solver takes to start up",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=STARTUP_BUDGET_MS,
+        help=f"with --import-time, flag solvers slower to start than this many milliseconds (default: {STARTUP_BUDGET_MS:.0f})",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args: argparse.Namespace = parse_args(argv)
+
+    names: List[str] = select_solvers(discover_solvers(), args.selectors)
+
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    if args.import_time:
+        startups: List[StartupResult] = [measure_startup(name) for name in names]
+        print(format_startup_table(startups, args.startup_budget))
+        over_budget: bool = any(
+            1000 * startup.startup_seconds > args.startup_budget for startup in startups
+        )
+        return 1 if over_budget else 0
+
+    jobs: int = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    cache: ResultCache = ResultCache()
+    if args.clear_cache:
+        cache.clear()
+
+    # a profiled run is pointless if nothing runs
+    read_cache: bool = not args.no_cache and not args.profile
+
+    start_time: float = time.perf_counter()
+    results: List[SolverResult] = run_solvers(
+        names, args.debug, args.show_output, jobs, args.profile, cache, read_cache
+    )
+    elapsed: float = time.perf_counter() - start_time
+
+    print(format_table(results))
+    if jobs > 1:
+        print(f"Ran on {jobs} workers in {elapsed:.3f}s of wall time")
+    if args.profile:
+        print(f"Profiles are in {profiler.PROFILE_DIRECTORY}")
+
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""Check day07B's joker-aware hand types against trying every joker replacement.
+
+day07B types a hand with jokers by adding the jokers to its most common other
+card. This script confirms that on all 13^5 possible hands, by comparing with the
+best raw type over every way of replacing the jokers with other cards, which is
+how day07B used to do it. Run it with "$ python3 verify_day07B.py" after changing
+how day07B types hands; it takes about half a minute.
+"""
+
+import itertools
+import sys
+from typing import List
+
+import day07B
+
+CARDS: str = "23456789TJQKA"
+
+# cards a joker can stand for
+JOKER_REPLACEMENTS: str = "23456789TQKA"
+
+
+def get_hand_type_by_enumeration(hand: str) -> int:
+    """Best raw type over every way to replace the hand's jokers."""
+    choices: List[str] = [JOKER_REPLACEMENTS if card == "J" else card for card in hand]
+
+    return max(
+        day07B.get_raw_hand_type("".join(replacement))
+        for replacement in itertools.product(*choices)
+    )
+
+
+def main() -> int:
+    num_hands: int = 0
+    mismatches: List[str] = []
+
+    for cards in itertools.product(CARDS, repeat=5):
+        hand: str = "".join(cards)
+        num_hands += 1
+
+        expected: int = get_hand_type_by_enumeration(hand)
+        actual: int = day07B.get_hand_type_while_interpreting_j(hand)
+        if actual != expected:
+            mismatches.append(f"{hand}: got {actual}, expected {expected}")
+
+    for mismatch in mismatches[:20]:
+        print(mismatch, file=sys.stderr)
+    print(f"{num_hands - len(mismatches)} of {num_hands} hands typed correctly")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())